@@ -3,3 +3,9 @@ DISCORD_CLIENT_ID = ''
 DISCORD_TOKEN = ''
 
 RIOT_GAMES_API_KEY = ''
+# Overrides the Riot Games API base URL, e.g. with the one printed by riot_stub_server.py. Empty uses Riot's.
+RIOT_GAMES_API_BASE_URL = ''
+
+# The geckodriver executable and log paths used by the browser pool of scrapers that need JavaScript.
+GECKODRIVER_PATH = 'geckodriver'
+GECKODRIVER_LOG_PATH = 'geckodriver.log'
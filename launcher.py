@@ -1,17 +1,6 @@
 import config
 from zoinks.bot import ZOINKS
-
-import logging
-import sys
-
-
-def setup_logging():
-    logging.getLogger('discord').setLevel(logging.WARNING)
-    logging.basicConfig(
-        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
-        datefmt="%Y-%m-%d %H:%M:%S",
-        level=logging.INFO,
-        stream=sys.stdout)
+from zoinks.log import setup_logging
 
 
 if __name__ == '__main__':
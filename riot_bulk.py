@@ -0,0 +1,104 @@
+from zoinks.log import setup_logging
+from zoinks.riot_games_api import RiotGamesAPI, REGION
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+
+logger = logging.getLogger(__name__)
+
+# The maximum requests in flight. The rate limiter decides how fast they are actually sent.
+DEFAULT_CONCURRENCY = 100
+
+
+async def resolve(api: RiotGamesAPI, kind: str, value: str, region: str):
+    """Resolves a single input line.
+
+    :return: The status and the parsed response, which is None unless the status is 200.
+    :rtype: tuple
+    """
+    if kind == 'summoners':
+        result = await api.get_summoner_by_name(name=value, region=region)
+    else:
+        result = await api.get_match_by_match_id(match_id=int(value), region=region)
+
+    if isinstance(result, int):
+        return result, None
+    return 200, result.to_dict()
+
+
+async def run(api: RiotGamesAPI, kind: str, lines, region: str, output, concurrency: int):
+    """Resolves every input line concurrently and writes each result as a JSON line as soon as it arrives.
+
+    Input is read lazily through a bounded queue, so files of any size use constant memory.
+
+    :return: The number of inputs that couldn't be resolved.
+    :rtype: int
+    """
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+    failed = 0
+
+    async def worker():
+        nonlocal failed
+        while True:
+            value = await queue.get()
+            if value is None:
+                return
+            try:
+                status, data = await resolve(api, kind, value, region)
+            except ValueError as e:
+                status, data = 400, None
+                logger.warning(f'Invalid input {value!r}: {e}')
+            if status != 200:
+                failed += 1
+            output.write(json.dumps({'input': value, 'status': status, 'data': data}) + '\n')
+            output.flush()
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    for line in lines:
+        value = line.strip()
+        if value:
+            await queue.put(value)
+    for _ in workers:
+        await queue.put(None)
+    await asyncio.gather(*workers)
+    return failed
+
+
+async def main_async(args):
+    api = RiotGamesAPI(base_url=args.base_url)
+    try:
+        with open(args.input, 'r', encoding='utf8') if args.input != '-' else sys.stdin as lines:
+            failed = await run(api, args.kind, lines, args.region, sys.stdout, args.concurrency)
+    finally:
+        await api.close()
+
+    logger.info(f'Done, {failed} inputs could not be resolved')
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Resolves summoner names or match IDs in bulk through the Riot Games API, '
+                    'writing one JSON line per input to stdout.')
+    parser.add_argument('kind', choices=('summoners', 'matches'),
+                        help='Whether the input lines are summoner names or match IDs.')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='The file of one input per line. Defaults to stdin.')
+    parser.add_argument('--region', default='na', choices=sorted(REGION))
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='The maximum requests in flight.')
+    parser.add_argument('--base-url', default=None,
+                        help='The Riot Games API base URL, e.g. of riot_stub_server.py.')
+    args = parser.parse_args()
+
+    setup_logging(stream=sys.stderr)
+    loop = asyncio.get_event_loop()
+    sys.exit(loop.run_until_complete(main_async(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import config
+from zoinks.log import setup_logging
+from zoinks.rate_limiter import RateLimitBucket, parse_rate_limit_header
+from zoinks.riot_games_api import URL
+
+import aiohttp
+from aiohttp import web
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import re
+import time
+from urllib.parse import urlencode
+
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = 'http://{host}:{port}/{{platform}}/lol/{{url}}'
+
+NOT_FOUND = {'status': {'message': 'Data not found', 'status_code': 404}}
+
+METHOD_PATTERNS = [
+    (key, re.compile('^' + re.sub(r'\\{[a-z_]+\\}', '[^/]+', re.escape(url)) + '$'))
+    for key, url in URL.items() if key != 'base']
+
+
+def method_from_path(path: str):
+    for key, pattern in METHOD_PATTERNS:
+        if pattern.match(path):
+            return key
+    return None
+
+
+class RiotStubServer:
+    """Represents a local stand-in for the Riot Games API.
+
+    Responses are replayed from JSON fixtures, rate limit headers and 429s are emulated per platform and per
+    method, and latency can be injected. In record mode, requests without a fixture are forwarded to the real
+    Riot Games API and their responses are saved as new fixtures.
+
+    Point RiotGamesAPI at it by setting config.RIOT_GAMES_API_BASE_URL to the printed base URL.
+    """
+
+    def __init__(self, fixtures_dir: str,
+                 app_rate_limit: str='20:1,100:120',
+                 method_rate_limit: str='',
+                 latency: float=0.0,
+                 jitter: float=0.0,
+                 record: bool=False):
+        """Constructs a new stand-in server.
+
+        :param fixtures_dir: The directory fixtures are replayed from and recorded to.
+        :param app_rate_limit: The emulated application rate limit, e.g. '20:1,100:120'.
+        :param method_rate_limit: The emulated rate limit of every method, e.g. '2000:60'. Empty disables it.
+        :param latency: The seconds added to every response.
+        :param jitter: The maximum random seconds added on top of latency.
+        :param record: Whether or not requests without a fixture are recorded from the real Riot Games API.
+        """
+        self.fixtures_dir = fixtures_dir
+        self.app_rate_limit = parse_rate_limit_header(app_rate_limit)
+        self.method_rate_limit = parse_rate_limit_header(method_rate_limit)
+        self.latency = latency
+        self.jitter = jitter
+        self.record = record
+
+        self._buckets = {}
+        self._session = None
+
+        self.app = web.Application()
+        self.app.router.add_get('/{platform}/lol/{path:.*}', self.handle)
+        self.app.on_cleanup.append(self._close_session)
+
+    async def _close_session(self, app):
+        if self._session is not None:
+            await self._session.close()
+
+    def _get_buckets(self, key: tuple, limits: list):
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            buckets = self._buckets[key] = [RateLimitBucket(limit, window) for limit, window in limits]
+        return buckets
+
+    def _fixture_path(self, platform: str, path: str, query: dict):
+        name = path
+        if query:
+            digest = hashlib.sha1(urlencode(sorted(query.items())).encode('utf8')).hexdigest()[:12]
+            name = f'{name}__{digest}'
+        return os.path.join(self.fixtures_dir, platform, f'{name}.json')
+
+    def _load_fixture(self, platform: str, path: str, query: dict):
+        for fixture_path in (self._fixture_path(platform, path, query), self._fixture_path(platform, path, {})):
+            if os.path.isfile(fixture_path):
+                with open(fixture_path, 'r', encoding='utf8') as file:
+                    return json.load(file)
+        return None
+
+    async def _record_fixture(self, platform: str, path: str, query: dict):
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+
+        url = URL['base'].format(platform=platform, url=path)
+        async with self._session.get(url, params=dict(query, api_key=config.RIOT_GAMES_API_KEY)) as response:
+            if response.status == 429:
+                return {'status': 429, 'body': None, 'retry_after': response.headers.get('Retry-After', '1')}
+            body = await response.json(content_type=None)
+            fixture = {'status': response.status, 'body': body}
+
+        fixture_path = self._fixture_path(platform, path, query)
+        os.makedirs(os.path.dirname(fixture_path), exist_ok=True)
+        with open(fixture_path, 'w', encoding='utf8') as file:
+            json.dump(fixture, file)
+        logger.info(f'Recorded {fixture["status"]}: {platform} {path}')
+        return fixture
+
+    def _rate_limit_headers(self, prefix: str, buckets: list):
+        if not buckets:
+            return {}
+        return {f'X-{prefix}-Rate-Limit': ','.join(f'{bucket.limit}:{bucket.window}' for bucket in buckets),
+                f'X-{prefix}-Rate-Limit-Count': ','.join(f'{bucket.count}:{bucket.window}' for bucket in buckets)}
+
+    async def handle(self, request):
+        platform = request.match_info['platform']
+        path = request.match_info['path']
+        query = {key: value for key, value in request.query.items() if key != 'api_key'}
+        method = method_from_path(path)
+
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        now = time.monotonic()
+        app_buckets = self._get_buckets(('app', platform), self.app_rate_limit)
+        method_buckets = (self._get_buckets(('method', platform, method), self.method_rate_limit)
+                          if method is not None else [])
+
+        app_delay = max([0] + [bucket.delay(now) for bucket in app_buckets])
+        method_delay = max([0] + [bucket.delay(now) for bucket in method_buckets])
+        if app_delay > 0 or method_delay > 0:
+            headers = self._rate_limit_headers('App', app_buckets)
+            headers.update(self._rate_limit_headers('Method', method_buckets))
+            headers['Retry-After'] = str(math.ceil(max(app_delay, method_delay)))
+            headers['X-Rate-Limit-Type'] = 'application' if app_delay >= method_delay else 'method'
+            return web.json_response({'status': {'message': 'Rate limit exceeded', 'status_code': 429}},
+                                     status=429, headers=headers)
+
+        for bucket in app_buckets + method_buckets:
+            bucket.consume(now)
+
+        headers = self._rate_limit_headers('App', app_buckets)
+        headers.update(self._rate_limit_headers('Method', method_buckets))
+
+        fixture = self._load_fixture(platform, path, query)
+        if fixture is None and self.record:
+            fixture = await self._record_fixture(platform, path, query)
+            if fixture['status'] == 429:
+                headers['Retry-After'] = fixture['retry_after']
+                headers['X-Rate-Limit-Type'] = 'service'
+        if fixture is None:
+            return web.json_response(NOT_FOUND, status=404, headers=headers)
+
+        return web.json_response(fixture['body'], status=fixture['status'], headers=headers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Runs a local stand-in for the Riot Games API.')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--fixtures', default='zoinks/data/riot_fixtures/',
+                        help='The directory fixtures are replayed from and recorded to.')
+    parser.add_argument('--app-rate-limit', default='20:1,100:120',
+                        help='The emulated application rate limit.')
+    parser.add_argument('--method-rate-limit', default='',
+                        help='The emulated rate limit of every method.')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='The seconds added to every response.')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='The maximum random seconds added on top of latency.')
+    parser.add_argument('--record', action='store_true',
+                        help='Records requests without a fixture from the real Riot Games API.')
+    args = parser.parse_args()
+
+    setup_logging()
+    server = RiotStubServer(fixtures_dir=args.fixtures,
+                            app_rate_limit=args.app_rate_limit,
+                            method_rate_limit=args.method_rate_limit,
+                            latency=args.latency,
+                            jitter=args.jitter,
+                            record=args.record)
+    logger.info(f'Base URL: {BASE_URL.format(host=args.host, port=args.port)}')
+    web.run_app(server.app, host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,9 @@
+from zoinks.browser_pool import BrowserPool
+from zoinks.http_client import HTTPClient
+
 import discord
 from discord.ext import commands
 
-import aiohttp
 import logging
 import os
 import time
@@ -23,7 +25,9 @@ class ZOINKS(commands.AutoShardedBot):
             description=description,
             pm_help=None)
 
-        self.session = aiohttp.ClientSession(loop=self.loop)
+        self.http_client = HTTPClient(loop=self.loop)
+        self.session = self.http_client.session
+        self.browser_pool = BrowserPool(loop=self.loop)
 
         extensions = set([
             f'zoinks.cogs.{os.path.splitext(module)[0]}'
@@ -44,7 +48,8 @@ class ZOINKS(commands.AutoShardedBot):
 
     async def close(self):
         await super().close()
-        await self.session.close()
+        await self.http_client.close()
+        await self.browser_pool.close()
 
     async def on_ready(self):
         await self.change_presence(activity=discord.Game(name=f'ZOINKS! | {self.command_prefix}help'))
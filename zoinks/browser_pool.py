@@ -0,0 +1,153 @@
+import config
+
+from selenium import webdriver
+from selenium.webdriver.firefox.options import Options
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+
+logger = logging.getLogger(__name__)
+
+# The seconds a page may take to load before the fetch fails.
+PAGE_LOAD_TIMEOUT = 30
+
+
+class BrowserWorker:
+    """Represents a long-lived headless Firefox that loads one page at a time."""
+
+    __slots__ = ('browser', 'pages')
+
+    def __init__(self, executable_path: str, log_path: str):
+        options = Options()
+        options.headless = True
+
+        self.browser = webdriver.Firefox(executable_path=executable_path,
+                                         firefox_options=options,
+                                         log_path=log_path)
+        self.browser.implicitly_wait(10)
+        self.browser.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        self.pages = 0
+
+    def fetch(self, url: str):
+        self.browser.get(url)
+        self.pages += 1
+        return self.browser.page_source
+
+    def quit(self):
+        try:
+            self.browser.quit()
+        except Exception as e:
+            logger.warning(f'Unable to quit browser: {e!r}')
+
+
+class BrowserPool:
+    """Represents a pool of headless browsers shared by every scraper that needs JavaScript to load.
+
+    Browsers are started on demand up to a size cap and reused between fetches, so a fetch doesn't pay for a
+    browser startup. A browser is replaced after max_pages pages, to bound its memory growth, or as soon as a
+    fetch with it fails. Fetches beyond max_waiting queued ones are dropped instead of piling up.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop=None,
+                 size: int=2,
+                 max_pages: int=50,
+                 max_waiting: int=8,
+                 executable_path: str=None,
+                 log_path: str=None):
+        """Constructs a new browser pool. No browser is started until the first fetch.
+
+        :param loop: The event loop of the currently running ZOINKS Discord bot.
+        :param size: The maximum browsers running at once.
+        :param max_pages: The pages a browser loads before it's replaced.
+        :param max_waiting: The maximum fetches waiting for a browser.
+        :param executable_path: The geckodriver path. Defaults to config.GECKODRIVER_PATH.
+        :param log_path: The geckodriver log path. Defaults to config.GECKODRIVER_LOG_PATH.
+        """
+        self.loop = loop or asyncio.get_event_loop()
+        self.size = size
+        self.max_pages = max_pages
+        self.max_waiting = max_waiting
+        self.executable_path = executable_path or config.GECKODRIVER_PATH
+        self.log_path = log_path or config.GECKODRIVER_LOG_PATH
+
+        self._executor = ThreadPoolExecutor(max_workers=size)
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle = []
+        self._workers = set()
+        self._waiting = 0
+
+    async def fetch(self, url: str):
+        """Loads the page at the specified URL in a pooled browser.
+
+        :param url: The URL of the page.
+        :return: The page source after JavaScript ran, or None if the page couldn't be loaded
+            or too many fetches are waiting.
+        :rtype: str
+        """
+        if self._waiting >= self.max_waiting:
+            logger.warning(f'Unable to fetch {url}: {self._waiting} fetches already waiting for a browser')
+            return None
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        worker = None
+        returned = False
+        starting = None
+        try:
+            if self._idle:
+                worker = self._idle.pop()
+            else:
+                starting = self.loop.run_in_executor(self._executor, self._start)
+                worker = await asyncio.shield(starting)
+                starting = None
+            content = await self.loop.run_in_executor(self._executor, worker.fetch, url)
+        except Exception as e:
+            logger.warning(f'Unable to fetch {url}: {e!r}')
+            return None
+        else:
+            if worker.pages < self.max_pages:
+                self._idle.append(worker)
+                returned = True
+            return content
+        finally:
+            if starting is not None:
+                # The fetch ended while its browser was starting, so the browser keeps the slot until it's quit.
+                starting.add_done_callback(self._discard_started)
+            else:
+                # A worker that failed, is worn out or was cancelled mid-fetch is quit instead of leaked.
+                if worker is not None and not returned:
+                    self._quit(worker)
+                self._semaphore.release()
+
+    def _start(self):
+        # Tracked from the executor thread, so close() finds a browser that finishes starting after it was called.
+        worker = BrowserWorker(self.executable_path, self.log_path)
+        self._workers.add(worker)
+        return worker
+
+    def _discard_started(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is None:
+            self._quit(future.result())
+        self._semaphore.release()
+
+    def _quit(self, worker: BrowserWorker):
+        if worker in self._workers:
+            self._workers.discard(worker)
+            self._executor.submit(worker.quit)
+
+    async def close(self):
+        """Quits every browser, including those still loading a page.
+
+        :return: None
+        """
+        workers, self._workers = self._workers, set()
+        self._idle = []
+        for worker in workers:
+            await self.loop.run_in_executor(self._executor, worker.quit)
+        self._executor.shutdown(wait=False)
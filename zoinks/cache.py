@@ -0,0 +1,58 @@
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """Represents a bounded in-memory cache that evicts the least recently used entry once full
+    and expires each entry after its own time to live.
+    """
+
+    __slots__ = ('max_size', 'hits', 'misses', '_entries')
+
+    def __init__(self, max_size: int=4096):
+        """Constructs a new cache.
+
+        :param max_size: The maximum number of entries held before the least recently used one is evicted.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Returns the value stored under the specified key, or default if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def set(self, key, value, ttl: float=None):
+        """Stores the value under the specified key.
+
+        :param ttl: The time in seconds until the entry expires. None never expires it.
+        """
+        self._entries[key] = (value, None if ttl is None else time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        self._entries.clear()
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -1,6 +1,12 @@
+import zoinks.match_analytics as match_analytics
 import zoinks.riot_games_api as riot_games_api
 import zoinks.utils as utils
-from zoinks.riot_games_api import RiotGamesAPI, PROFILE_ICON_URL, REGION
+from zoinks.match_ingestion import MatchIngester
+from zoinks.rate_limiter import PRIORITY_BACKGROUND
+from zoinks.riot_games_api import (RiotGamesAPI, CHAMPION_ICON_URL, DEFAULT_VERSION, ITEM_ICON_URL,
+                                   PROFILE_ICON_URL, REGION, REQUEST_TIMEOUT)
+from zoinks.static_data import StaticDataStore
+from zoinks.summoner_watcher import SummonerWatcher
 
 import discord
 from discord.ext import commands
@@ -15,6 +21,40 @@ logger = logging.getLogger(__name__)
 
 color = 0x96692A
 
+DEFAULT_HISTORY_GAMES = 20
+MAX_HISTORY_GAMES = 100
+
+# The maximum match requests in flight for a single command.
+MATCH_FETCH_CONCURRENCY = 10
+
+# The maximum rank and mastery requests in flight for a single live game lookup.
+LIVE_LOOKUP_CONCURRENCY = 8
+
+# The minimum seconds between edits of a live game embed, so its edits stay under Discord's rate limit.
+LIVE_EDIT_INTERVAL = 1.0
+
+TEAM_NAME = {100: 'Blue Team', 200: 'Red Team'}
+
+# The seconds !profile waits for Riot Games API responses before it's sent without the missing ones.
+PROFILE_DEADLINE = 3
+
+# The seconds after which responses missing from a sent profile are no longer waited for to edit them in.
+PROFILE_LATE_DEADLINE = 30
+
+UNAVAILABLE = 'Unavailable'
+
+# The alternatives listed under a fuzzy search result.
+MAX_ALTERNATIVES = 3
+
+# The matches shown per page of the match browser.
+MATCHES_PER_PAGE = 5
+
+# The seconds the match browser waits for a page reaction before it stops listening.
+MATCHES_TIMEOUT = 120
+
+PREVIOUS_PAGE = '◀'
+NEXT_PAGE = '▶'
+
 
 class LeagueOfLegends:
 
@@ -24,25 +64,16 @@ class LeagueOfLegends:
 
         self.valid_summoner_name_chars = set(string.ascii_letters + string.digits + '.' + '_' + '')
 
-        self.static_champion_data = None
-        self.static_item_data = None
-        self.static_map_data = None
-        self.static_profile_icon_data = None
-        self.static_reforged_rune_path_data = None
-        self.static_reforged_rune_data = None
-        self.static_summoner_spell_data = None
+        self.static_data = StaticDataStore(self.bot, self.api)
+
+        self.ingester = MatchIngester(self.api.with_priority(PRIORITY_BACKGROUND))
+        self.watcher = SummonerWatcher(self.bot, self.api, self.static_data, ingester=self.ingester)
+        self.bot.loop.create_task(self.watcher.run())
 
         logger.info(f'{self.__class__.__name__} loaded')
 
     async def on_ready(self):
-        self.static_champion_data = await self.api.get_static_champion_data(tags='all', data_by_id=True)
-        self.static_item_data = await self.api.get_static_item_data(tags='all')
-        self.static_map_data = await self.api.get_static_map_data()
-        self.static_reforged_rune_path_data = await self.api.get_static_reforged_rune_path_data()
-        self.static_reforged_rune_data = await self.api.get_static_reforged_rune_data()
-        self.static_summoner_spell_data = await self.api.get_static_summoner_spell_data(tags='all', data_by_id=True)
-        logger.info(f'Static {self.__class__.__name__} data loaded')
-        await asyncio.sleep(10)
+        self.static_data.refresh_in_background()
 
     @commands.command()
     async def regions(self, ctx):
@@ -60,133 +91,263 @@ class LeagueOfLegends:
                              description=description,
                              color=0xFFC83D)
 
-    @commands.command()
-    async def profile(self, ctx, region: str, *, name: str):
-        """Displays the profile of the specified summoner name."""
-        region = region.lower()
+    async def _get_summoner(self, ctx, region: str, name: str, api: RiotGamesAPI=None):
+        """Fetches the specified summoner, or displays why it couldn't be fetched.
+
+        :param api: The client view to fetch with. Defaults to the cog's client.
+        :return: The summoner, or None if an error was displayed.
+        :rtype: zoinks.riot_models.Summoner
+        """
+        api = api or self.api
 
         if region not in REGION:
-            return await ctx.send(embed=self._error_embed(
+            await ctx.send(embed=self._error_embed(
                 description='Invalid region entered. '
                             f'Use `{self.bot.command_prefix}regions` to view available regions.'))
+            return None
 
         name = ''.join(ch for ch in name if ch in self.valid_summoner_name_chars)
 
         if not name or len(name) < 3 or len(name) > 16:
-            return await ctx.send(embed=self._error_embed(
+            await ctx.send(embed=self._error_embed(
                 description='Invalid summoner name entered.'))
+            return None
 
-        summoner = await self.api.get_summoner_by_name(name=name, region=region)
+        summoner = await api.get_summoner_by_name(name=name, region=region)
         if isinstance(summoner, int):
             if summoner == 404:
-                return await ctx.send(embed=self._error_embed(
+                await ctx.send(embed=self._error_embed(
                     description=f'Invalid summoner name entered.'))
+            elif summoner == REQUEST_TIMEOUT:
+                await ctx.send(embed=self._error_embed(
+                    description='The Riot Games API is slow to respond at the moment. Try again later.'))
             else:
-                return await ctx.send(embed=self._error_embed(
+                await ctx.send(embed=self._error_embed(
                     description=f'Something went wrong!\n\nError code: {summoner}'))
+            return None
+
+        return summoner
+
+    def _search_embed(self, title: str, query: str, results: list, name_from_key):
+        """Builds the embed of a fuzzy search, or an error embed if nothing matched.
+
+        :param results: The (key, score) pairs returned by a TrigramIndex search.
+        :param name_from_key: Returns the display name of a result key.
+        """
+        if not results:
+            return self._error_embed(description=f'Nothing found for `{query}`.')
+
+        key, score = results[0]
+        embed = discord.Embed(title=title, description=f'**{name_from_key(key)}**\nID: {key}', color=color)
+        alternatives = results[1:MAX_ALTERNATIVES + 1]
+        if alternatives:
+            embed.add_field(name='Did You Mean',
+                            value='\n'.join(name_from_key(alternative) for alternative, _ in alternatives))
+        return embed
+
+    @commands.command(aliases=['champion'])
+    async def champ(self, ctx, *, name: str):
+        """Looks up a champion by its name, even if it's misspelled or incomplete."""
+        if not await self.static_data.wait_until_loaded():
+            return await ctx.send(embed=self._error_embed(
+                description='Unable to fetch data at the moment. Try again later.'))
+
+        results = self.static_data.champion_index.search(name, limit=MAX_ALTERNATIVES + 1)
+        embed = self._search_embed('League of Legends Champion', name, results, self.static_data.champion_name)
+        if results:
+            embed.set_thumbnail(url=CHAMPION_ICON_URL.format(version=self.static_data.version,
+                                                             key=self.static_data.champion_key(results[0][0])))
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def item(self, ctx, *, name: str):
+        """Looks up an item by its name, even if it's misspelled or incomplete."""
+        if not await self.static_data.wait_until_loaded():
+            return await ctx.send(embed=self._error_embed(
+                description='Unable to fetch data at the moment. Try again later.'))
 
-        account_id = summoner.get('accountId')
-        summoner_id = summoner.get('id')
+        results = self.static_data.item_index.search(name, limit=MAX_ALTERNATIVES + 1)
+        embed = self._search_embed('League of Legends Item', name, results,
+                                   lambda item_id: self.static_data.items.get(str(item_id)))
+        if results:
+            embed.set_thumbnail(url=ITEM_ICON_URL.format(version=self.static_data.version, item_id=results[0][0]))
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    async def spell(self, ctx, *, name: str):
+        """Looks up a summoner spell by its name, even if it's misspelled or incomplete."""
+        if not await self.static_data.wait_until_loaded():
+            return await ctx.send(embed=self._error_embed(
+                description='Unable to fetch data at the moment. Try again later.'))
+
+        results = self.static_data.summoner_spell_index.search(name, limit=MAX_ALTERNATIVES + 1)
+        await ctx.send(embed=self._search_embed('League of Legends Summoner Spell', name, results,
+                                                lambda spell_id: self.static_data.summoner_spells.get(str(spell_id))))
+
+    async def _search_error(self, ctx, error):
+        if isinstance(error, commands.errors.MissingRequiredArgument):
+            await ctx.send(embed=self._error_embed(description='No name entered.'))
+
+    @champ.error
+    async def champ_error(self, ctx, error):
+        await self._search_error(ctx, error)
+
+    @item.error
+    async def item_error(self, ctx, error):
+        await self._search_error(ctx, error)
+
+    @spell.error
+    async def spell_error(self, ctx, error):
+        await self._search_error(ctx, error)
+
+    @commands.command()
+    async def profile(self, ctx, region: str, *, name: str):
+        """Displays the profile of the specified summoner name."""
+        region = region.lower()
+
+        api = self.api.with_deadline(PROFILE_DEADLINE)
 
-        name = summoner.get('name')
-        level = summoner.get('summonerLevel')
-        profile_icon = summoner.get('profileIconId')
+        summoner = await self._get_summoner(ctx, region, name, api=api)
+        if summoner is None:
+            return
+
+        try:
+            static_data_loaded = await asyncio.wait_for(self.static_data.wait_until_loaded(),
+                                                        timeout=max(api.deadline - self.bot.loop.time(), 0))
+        except asyncio.TimeoutError:
+            static_data_loaded = False
+
+        if not static_data_loaded:
+            return await ctx.send(embed=self._error_embed(
+                description='Unable to fetch data at the moment. Try again later.'))
+
+        league, champion_mastery, last_game = await asyncio.gather(
+            api.get_league_by_summoner_id(summoner_id=summoner.id, region=region),
+            api.get_champion_mastery_by_summoner_id(summoner_id=summoner.id, region=region),
+            self._get_last_game(summoner_id=summoner.id, account_id=summoner.account_id, region=region, api=api))
+
+        message = await ctx.send(embed=self._profile_embed(region, summoner, league, champion_mastery, last_game))
+
+        if REQUEST_TIMEOUT not in (league, champion_mastery, last_game):
+            return
+
+        # The timed out requests are still running, so waiting on the same calls again picks up their responses.
+        api = self.api.with_deadline(PROFILE_LATE_DEADLINE)
+        league, champion_mastery, last_game = await asyncio.gather(
+            api.get_league_by_summoner_id(summoner_id=summoner.id, region=region),
+            api.get_champion_mastery_by_summoner_id(summoner_id=summoner.id, region=region),
+            self._get_last_game(summoner_id=summoner.id, account_id=summoner.account_id, region=region, api=api))
+
+        await message.edit(embed=self._profile_embed(region, summoner, league, champion_mastery, last_game))
+
+    def _profile_embed(self, region: str, summoner, league, champion_mastery, last_game):
+        """Builds the profile embed from whichever responses are available.
+
+        Sections whose response timed out are shown as unavailable.
+        """
+        summoner_id = summoner.id
+        name = summoner.name
+        level = summoner.level
+        profile_icon = summoner.profile_icon_id
         op_gg = f'http://{region}.op.gg/summoner/userName={name.replace(" ", "")}'
 
         embed = discord.Embed(title='League of Legends Profile',
                               description=f'[{name}]({op_gg})\nRegion: {REGION[region]["name"]}\nLevel: {level}',
                               color=color)
-        embed.set_thumbnail(url=PROFILE_ICON_URL.format(icon_id=profile_icon))
-
-        league = await self.api.get_league_by_summoner_id(summoner_id=summoner_id, region=region)
-        if isinstance(league, list) and league:
-            tier = league[0].get('tier').title()
-            rank = league[0].get('rank')
-            lp = league[0].get('leaguePoints')
-            wins = league[0].get('wins')
-            losses = league[0].get('losses')
-            ratio = f'{100 * wins / (wins + losses):.1f}'
+        embed.set_thumbnail(url=PROFILE_ICON_URL.format(version=self.static_data.version or DEFAULT_VERSION,
+                                                        icon_id=profile_icon))
+
+        if league == REQUEST_TIMEOUT:
+            embed.add_field(name='Ranked Stats', value=UNAVAILABLE)
+        elif isinstance(league, list) and league:
+            entry = league[0]
+            tier = entry.tier.title()
+            rank = entry.rank
+            lp = entry.league_points
+            wins = entry.wins
+            losses = entry.losses
+            ratio = f'{100 * entry.win_rate:.1f}'
 
             embed.add_field(name='Ranked Stats',
                             value=f'**{tier} {rank}** ({lp} LP)\n{wins}W/{losses}L\nWinrate: **{ratio}%**')
 
-        if self.static_champion_data is None or isinstance(self.static_champion_data, int):
-            self.static_champion_data = await self.api.get_static_champion_data(tags='all', data_by_id=True)
-
-        if isinstance(self.static_champion_data, int):
-            return await ctx.send(embed=self._error_embed(
-                description='Unable to fetch data at the moment. Try again later.'))
-
-        champion_mastery = await self.api.get_champion_mastery_by_summoner_id(summoner_id=summoner_id, region=region)
-        if isinstance(champion_mastery, list) and champion_mastery:
+        if champion_mastery == REQUEST_TIMEOUT:
+            embed.add_field(name='Champion Mastery', value=UNAVAILABLE)
+        elif isinstance(champion_mastery, list) and champion_mastery:
             champions_to_display = 3 if len(champion_mastery) > 3 else len(champion_mastery)
 
             field_text = ''
-            for i in range(0, champions_to_display):
-                champion_id = champion_mastery[i].get('championId')
-                champion_name = self.static_champion_data['keys'][str(champion_id)]
-                champion_level = champion_mastery[i].get('championLevel')
-                champion_points = champion_mastery[i].get('championPoints')
+            for i, entry in enumerate(champion_mastery[:champions_to_display]):
+                champion_name = self.static_data.champion_name(entry.champion_id)
+                champion_level = entry.champion_level
+                champion_points = entry.champion_points
                 field_text = (f'{field_text}'
                               f'{i + 1}. Level **{champion_level}**: {champion_name} ({champion_points} XP)\n')
             embed.add_field(name='Champion Mastery', value=field_text)
 
-        spectator = await self.api.get_active_game_by_summoner_id(summoner_id=summoner_id, region=region)
-        if isinstance(spectator, dict) and spectator:
-            champion_id = ''
-            for participant in spectator['participants']:
-                if participant.get('summonerId') == summoner_id:
-                    champion_id = participant.get('championId')
-                    break
+        if last_game == REQUEST_TIMEOUT:
+            embed.add_field(name='Last Seen', value=UNAVAILABLE, inline=False)
+            return embed
 
-            queue_id = spectator.get('gameQueueConfigId')
-            queue_name = riot_games_api.queue_name_from_id(id_=queue_id)
-            champion_name = self.static_champion_data['keys'][str(champion_id)]
+        spectator, match = last_game
+        if spectator is not None and spectator.participant(summoner_id) is not None:
+            queue_name = riot_games_api.queue_name_from_id(id_=spectator.queue_id)
+            champion_name = self.static_data.champion_name(spectator.participant(summoner_id).champion_id)
 
             embed.add_field(name='Last Seen',
                             value=f'Now playing a {queue_name} as {champion_name}', inline=False)
-        else:
-            match_history = await self.api.get_match_list_by_account_id(account_id=account_id, region=region,
-                                                                        end_index=1)
-            if isinstance(match_history, dict) and match_history:
-                match_id = match_history['matches'][0]['gameId']
-
-                match = await self.api.get_match_by_match_id(match_id=match_id, region=region)
-                if isinstance(match, dict) and match:
-                    participant_id = ''
-                    for participant in match.get('participantIdentities'):
-                        if participant.get('player').get('summonerId') == summoner_id:
-                            participant_id = participant.get('participantId')
-                            break
-
-                    player = ''
-                    for participant in match.get('participants'):
-                        if participant.get('participantId') == participant_id:
-                            player = participant
-                            break
-
-                    queue_id = match.get('queueId')
-                    queue_name = riot_games_api.queue_name_from_id(id_=queue_id)
-                    time_since_game = utils.datetime_to_time_ago_string(
-                        datetime.now() - datetime.fromtimestamp(match.get('gameCreation') / 1000.0))
-                    champion_id = player.get('championId')
-                    champion_name = self.static_champion_data['keys'][str(champion_id)]
-                    kills = player.get('stats').get('kills')
-                    deaths = player.get('stats').get('deaths')
-                    assists = player.get('stats').get('assists')
-                    cs = player.get('stats').get('totalMinionsKilled', 0)
-                    won = player.get('stats').get('win')
-                    won = 'won' if won else 'lost'
-
-                    embed.add_field(name='Last Seen',
-                                    value=f'{time_since_game}, {won} a {queue_name} '
-                                          f'as {champion_name} with a {kills}/{deaths}/{assists} KDA and {cs} CS',
-                                    inline=False)
+        elif match is not None and match.participant(summoner_id) is not None:
+            player = match.participant(summoner_id)
+
+            queue_name = riot_games_api.queue_name_from_id(id_=match.queue_id)
+            time_since_game = utils.datetime_to_time_ago_string(
+                datetime.now() - datetime.fromtimestamp(match.game_creation / 1000.0))
+            champion_name = self.static_data.champion_name(player.champion_id)
+            kills = player.kills
+            deaths = player.deaths
+            assists = player.assists
+            cs = player.cs
+            won = 'won' if player.win else 'lost'
 
-        await ctx.send(embed=embed)
-
-    @profile.error
-    async def profile_error(self, ctx, error):
+            embed.add_field(name='Last Seen',
+                            value=f'{time_since_game}, {won} a {queue_name} '
+                                  f'as {champion_name} with a {kills}/{deaths}/{assists} KDA and {cs} CS',
+                            inline=False)
+
+        return embed
+
+    async def _get_last_game(self, summoner_id: int, account_id: int, region: str, api: RiotGamesAPI=None):
+        """Fetches the game the summoner is playing now, or their most recent match if they aren't in one.
+
+        :param api: The client view to fetch with. Defaults to the cog's client.
+        :return: The active game and the most recent match, at most one of which is set,
+            or REQUEST_TIMEOUT if a request didn't finish by the view's deadline.
+        :rtype: tuple
+        """
+        api = api or self.api
+
+        spectator = await api.get_active_game_by_summoner_id(summoner_id=summoner_id, region=region)
+        if spectator == REQUEST_TIMEOUT:
+            return REQUEST_TIMEOUT
+        if not isinstance(spectator, int):
+            return spectator, None
+
+        match_history = await api.get_match_list_by_account_id(account_id=account_id, region=region, end_index=1)
+        if match_history == REQUEST_TIMEOUT:
+            return REQUEST_TIMEOUT
+        if not isinstance(match_history, dict) or not match_history.get('matches'):
+            return None, None
+
+        match_id = match_history['matches'][0]['gameId']
+        match = await api.get_match_by_match_id(match_id=match_id, region=region)
+        if match == REQUEST_TIMEOUT:
+            return REQUEST_TIMEOUT
+        if isinstance(match, int):
+            return None, None
+
+        return None, match
+
+    async def _argument_error(self, ctx, error):
         if isinstance(error, commands.errors.MissingRequiredArgument):
             if error.param.name == 'region':
                 await ctx.send(embed=self._error_embed(
@@ -196,6 +357,316 @@ class LeagueOfLegends:
                 await ctx.send(embed=self._error_embed(
                     description='No summoner name entered.'))
 
+    @profile.error
+    async def profile_error(self, ctx, error):
+        await self._argument_error(ctx, error)
+
+    @commands.command()
+    async def history(self, ctx, region: str, *, name: str):
+        """Summarizes the last games (20 by default, up to 100) of the specified summoner name."""
+        region = region.lower()
+
+        games = DEFAULT_HISTORY_GAMES
+        words = name.split()
+        if len(words) > 1 and words[-1].isdigit():
+            games = max(1, min(int(words[-1]), MAX_HISTORY_GAMES))
+            name = ' '.join(words[:-1])
+
+        summoner = await self._get_summoner(ctx, region, name)
+        if summoner is None:
+            return
+
+        summoner_id = summoner.id
+        name = summoner.name
+
+        match_history = await self.api.get_match_list_by_account_id(account_id=summoner.account_id,
+                                                                    region=region, end_index=games)
+        if not isinstance(match_history, dict) or not match_history.get('matches'):
+            return await ctx.send(embed=self._error_embed(
+                description=f'No recent games found for {name}.'))
+
+        semaphore = asyncio.Semaphore(MATCH_FETCH_CONCURRENCY)
+
+        async def get_match(match_id):
+            async with semaphore:
+                return await self.api.get_match_by_match_id(match_id=match_id, region=region)
+
+        matches = await asyncio.gather(*[get_match(match['gameId']) for match in match_history['matches']])
+        summary = match_analytics.summarize_matches(
+            [match for match in matches if not isinstance(match, int)], summoner_id=summoner_id)
+
+        if summary is None:
+            return await ctx.send(embed=self._error_embed(
+                description='Unable to fetch data at the moment. Try again later.'))
+
+        await self.static_data.wait_until_loaded()
+
+        embed = discord.Embed(title='League of Legends Match History',
+                              description=f'{name}\nRegion: {REGION[region]["name"]}\n'
+                                          f'Last {summary["games"]} games',
+                              color=color)
+
+        embed.add_field(name='Overall',
+                        value=f'{summary["wins"]}W/{summary["games"] - summary["wins"]}L\n'
+                              f'Winrate: **{100 * summary["win_rate"]:.1f}%**\n'
+                              f'KDA: **{summary["kda"]:.2f}** ({summary["kills"]:.1f}/{summary["deaths"]:.1f}/'
+                              f'{summary["assists"]:.1f})\n'
+                              f'CS/min: **{summary["cs_per_min"]:.1f}**')
+
+        field_text = ''
+        for i, (champion_id, champion_games, win_rate, kda) in enumerate(summary['champions'][:5]):
+            champion_name = self.static_data.champion_name(champion_id)
+            field_text = (f'{field_text}'
+                          f'{i + 1}. {champion_name}: {champion_games} games, '
+                          f'{100 * win_rate:.0f}% WR, {kda:.2f} KDA\n')
+        embed.add_field(name='Most Played Champions', value=field_text)
+
+        await ctx.send(embed=embed)
+
+    @history.error
+    async def history_error(self, ctx, error):
+        await self._argument_error(ctx, error)
+
+    async def _match_pages(self, account_id: int, region: str):
+        """Pages through the account's matches, newest first, fetching each page's matches only when it's reached.
+
+        :return: An async generator of lists of matches.
+        :rtype: list of zoinks.riot_models.Match
+        """
+        semaphore = asyncio.Semaphore(MATCH_FETCH_CONCURRENCY)
+
+        async def get_match(match_id):
+            async with semaphore:
+                return await self.api.get_match_by_match_id(match_id=match_id, region=region)
+
+        async for references in self.api.iter_match_list_by_account_id(account_id=account_id, region=region):
+            if isinstance(references, int):
+                return
+            for i in range(0, len(references), MATCHES_PER_PAGE):
+                matches = await asyncio.gather(*[get_match(reference['gameId'])
+                                                 for reference in references[i:i + MATCHES_PER_PAGE]])
+                yield [match for match in matches if not isinstance(match, int)]
+
+    def _match_page_embed(self, summoner, region: str, matches: list, page: int):
+        embed = discord.Embed(title='League of Legends Matches',
+                              description=f'{summoner.name}\nRegion: {REGION[region]["name"]}\nPage {page + 1}',
+                              color=color)
+
+        for match in matches:
+            player = match.participant(summoner.id)
+            if player is None:
+                continue
+
+            queue_name = riot_games_api.queue_name_from_id(id_=match.queue_id)
+            champion_name = self.static_data.champion_name(player.champion_id)
+            time_since_game = utils.datetime_to_time_ago_string(
+                datetime.now() - datetime.fromtimestamp(match.game_creation / 1000.0))
+            won = 'Won' if player.win else 'Lost'
+
+            embed.add_field(name=f'{won} a {queue_name} as {champion_name}',
+                            value=f'{player.kills}/{player.deaths}/{player.assists} KDA, {player.cs} CS, '
+                                  f'{match.game_duration // 60} min\n{time_since_game}',
+                            inline=False)
+        return embed
+
+    @commands.command()
+    async def matches(self, ctx, region: str, *, name: str):
+        """Pages through the match history of the specified summoner name."""
+        region = region.lower()
+
+        summoner = await self._get_summoner(ctx, region, name)
+        if summoner is None:
+            return
+
+        pages = self._match_pages(account_id=summoner.account_id, region=region)
+        viewed = []
+        prefetch = asyncio.ensure_future(pages.__anext__())
+
+        async def next_page():
+            nonlocal prefetch
+            try:
+                matches = await prefetch
+            except StopAsyncIteration:
+                return False
+            viewed.append(matches)
+            prefetch = asyncio.ensure_future(pages.__anext__())
+            return True
+
+        try:
+            if not await next_page():
+                return await ctx.send(embed=self._error_embed(
+                    description=f'No recent games found for {summoner.name}.'))
+
+            page = 0
+            message = await ctx.send(embed=self._match_page_embed(summoner, region, viewed[page], page))
+            await message.add_reaction(PREVIOUS_PAGE)
+            await message.add_reaction(NEXT_PAGE)
+
+            def check(reaction, user):
+                return (reaction.message.id == message.id and user == ctx.author and
+                        str(reaction.emoji) in (PREVIOUS_PAGE, NEXT_PAGE))
+
+            while True:
+                try:
+                    reaction, user = await ctx.bot.wait_for('reaction_add', check=check, timeout=MATCHES_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+
+                try:
+                    await message.remove_reaction(reaction.emoji, user)
+                except (discord.Forbidden, discord.NotFound):
+                    pass
+
+                if str(reaction.emoji) == PREVIOUS_PAGE and page > 0:
+                    page -= 1
+                elif str(reaction.emoji) == NEXT_PAGE and (page + 1 < len(viewed) or await next_page()):
+                    page += 1
+                else:
+                    continue
+
+                await message.edit(embed=self._match_page_embed(summoner, region, viewed[page], page))
+
+            try:
+                await message.clear_reactions()
+            except (discord.Forbidden, discord.NotFound):
+                pass
+        finally:
+            prefetch.cancel()
+            try:
+                await prefetch
+            except (asyncio.CancelledError, StopAsyncIteration):
+                pass
+            await pages.aclose()
+
+    @matches.error
+    async def matches_error(self, ctx, error):
+        await self._argument_error(ctx, error)
+
+    @commands.command()
+    async def live(self, ctx, region: str, *, name: str):
+        """Displays the ranks and top champions of everyone in the specified summoner's current game."""
+        region = region.lower()
+
+        summoner = await self._get_summoner(ctx, region, name)
+        if summoner is None:
+            return
+
+        spectator = await self.api.get_active_game_by_summoner_id(summoner_id=summoner.id, region=region)
+        if isinstance(spectator, int):
+            if spectator == 404:
+                return await ctx.send(embed=self._error_embed(
+                    description=f'{summoner.name} isn\'t in a game right now.'))
+            return await ctx.send(embed=self._error_embed(
+                description=f'Something went wrong!\n\nError code: {spectator}'))
+
+        game = spectator
+        participants = game.participants
+        ranks = {}
+        masteries = {}
+
+        def build_embed():
+            queue_name = riot_games_api.queue_name_from_id(id_=game.queue_id)
+            embed = discord.Embed(title='League of Legends Live Game',
+                                  description=f'{summoner.name} is playing a {queue_name}\n'
+                                              f'Region: {REGION[region]["name"]}',
+                                  color=color)
+            for team_id, team_name in TEAM_NAME.items():
+                field_text = ''
+                for participant in participants:
+                    if participant.team_id != team_id:
+                        continue
+                    champion_name = self.static_data.champion_name(participant.champion_id)
+                    rank = ranks.get(participant.summoner_id, '...')
+                    mastery = masteries.get(participant.summoner_id, '...')
+                    field_text = (f'{field_text}'
+                                  f'**{champion_name}** {participant.summoner_name}\n{rank} | {mastery}\n')
+                if field_text:
+                    embed.add_field(name=team_name, value=field_text)
+            return embed
+
+        message = await ctx.send(embed=build_embed())
+
+        semaphore = asyncio.Semaphore(LIVE_LOOKUP_CONCURRENCY)
+
+        async def get_rank(summoner_id):
+            async with semaphore:
+                league = await self.api.get_league_by_summoner_id(summoner_id=summoner_id, region=region)
+            if not isinstance(league, list):
+                ranks[summoner_id] = 'Rank unavailable'
+                return
+            entry = next((entry for entry in league if entry.queue_type == 'RANKED_SOLO_5x5'), None)
+            ranks[summoner_id] = (f'{entry.tier.title()} {entry.rank} ({entry.league_points} LP)'
+                                  if entry is not None else 'Unranked')
+
+        async def get_mastery(summoner_id):
+            async with semaphore:
+                champion_mastery = await self.api.get_champion_mastery_by_summoner_id(summoner_id=summoner_id,
+                                                                                      region=region)
+            if not isinstance(champion_mastery, list) or not champion_mastery:
+                masteries[summoner_id] = 'No mastery'
+                return
+            entry = champion_mastery[0]
+            masteries[summoner_id] = (f'{self.static_data.champion_name(entry.champion_id)} '
+                                      f'({entry.champion_points} XP)')
+
+        lookups = [get_rank(participant.summoner_id) for participant in participants]
+        lookups += [get_mastery(participant.summoner_id) for participant in participants]
+
+        edited_at = self.bot.loop.time()
+        pending = len(lookups)
+        for lookup in asyncio.as_completed(lookups):
+            await lookup
+            pending -= 1
+            if pending and self.bot.loop.time() - edited_at >= LIVE_EDIT_INTERVAL:
+                await message.edit(embed=build_embed())
+                edited_at = self.bot.loop.time()
+
+        await message.edit(embed=build_embed())
+
+    @live.error
+    async def live_error(self, ctx, error):
+        await self._argument_error(ctx, error)
+
+    @commands.command()
+    @commands.guild_only()
+    async def track(self, ctx, region: str, *, name: str):
+        """Posts rank changes and new games of the specified summoner name in this channel."""
+        region = region.lower()
+
+        summoner = await self._get_summoner(ctx, region, name)
+        if summoner is None:
+            return
+
+        if self.watcher.track(region, summoner, ctx.channel.id):
+            description = f'Rank changes and new games of {summoner.name} will be posted in {ctx.channel.mention}.'
+        else:
+            description = f'{summoner.name} is already tracked in {ctx.channel.mention}.'
+        await ctx.send(embed=discord.Embed(title='🔔 Summoner Tracking', description=description, color=color))
+
+    @track.error
+    async def track_error(self, ctx, error):
+        await self._argument_error(ctx, error)
+
+    @commands.command()
+    @commands.guild_only()
+    async def untrack(self, ctx, region: str, *, name: str):
+        """Stops posting updates about the specified summoner name in this channel."""
+        region = region.lower()
+
+        summoner = await self._get_summoner(ctx, region, name)
+        if summoner is None:
+            return
+
+        if self.watcher.untrack(region, summoner.id, ctx.channel.id):
+            description = f'{summoner.name} is no longer tracked in {ctx.channel.mention}.'
+        else:
+            description = f'{summoner.name} isn\'t tracked in {ctx.channel.mention}.'
+        await ctx.send(embed=discord.Embed(title='🔕 Summoner Tracking', description=description, color=color))
+
+    @untrack.error
+    async def untrack_error(self, ctx, error):
+        await self._argument_error(ctx, error)
+
 
 def setup(bot):
     bot.add_cog(LeagueOfLegends(bot))
@@ -1,5 +1,6 @@
 import zoinks.bot
 
+import aiohttp
 import discord
 from discord.ext import commands
 
@@ -103,12 +104,18 @@ class RNG:
 
         embed = discord.Embed(title='📚 Scrambled Word Puzzle', color=zoinks.bot.color)
 
-        async with self.bot.session.post(url='http://watchout4snakes.com/wo4snakes/Random/RandomWord') as response:
-            if response.status >= 400:
-                embed.description = 'Unable to connect to the word generator. Please try again later.'
-                return await ctx.send(embed=embed)
-            else:
-                word = await response.text()
+        try:
+            async with self.bot.http_client.post('http://watchout4snakes.com/wo4snakes/Random/RandomWord') as response:
+                if response.status >= 400:
+                    word = None
+                else:
+                    word = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            word = None
+
+        if not word:
+            embed.description = 'Unable to connect to the word generator. Please try again later.'
+            return await ctx.send(embed=embed)
 
         scrambled_word = ''.join(random.sample(word, len(word)))
 
@@ -1,8 +1,10 @@
 import zoinks.bot
 import zoinks.utils as utils
+from zoinks.scraper_scheduler import ScraperScheduler
 from zoinks.web_scraper import WebScraper, SteamScraper
 
 import discord
+from bs4 import SoupStrainer
 from discord.ext import commands
 
 import logging
@@ -17,6 +19,8 @@ class LeagueOfLegendsScraper(WebScraper):
 
     BASE_URL = 'https://na.leagueoflegends.com'
 
+    LATEST_PATCH = SoupStrainer(class_='views-row views-row-1 views-row-odd views-row-first')
+
     def __init__(self, bot):
         super().__init__(bot,
                          output_channel_id=OUTPUT_CHANNEL_ID[0],
@@ -27,10 +31,12 @@ class LeagueOfLegendsScraper(WebScraper):
                          delay=60 * 60 * 24,
                          author=('League of Legends', self.BASE_URL),
                          color=0x96692A,
-                         thumbnail_url='https://i.imgur.com/FaQI0Mw.png')
+                         thumbnail_url='https://i.imgur.com/FaQI0Mw.png',
+                         parse_only=self.LATEST_PATCH,
+                         stop_after=utils.StopAfter(class_='views-row views-row-1 views-row-odd views-row-first'))
 
     async def build_embed(self, url):
-        soup = await utils.fetch_soup(self.bot, self.source_url)
+        soup = await self.fetch_soup(self.source_url, parse_only=self.parse_only, stop_after=self.stop_after)
 
         if soup is None:
             return None
@@ -77,7 +83,9 @@ class DotaScraper(WebScraper):
             delay=60 * 60 * 24,
             author=('Dota 2', ''),
             color=0xFB3512,
-            thumbnail_url='https://steamcdn-a.akamaihd.net/steam/apps/570/capsule_184x69.jpg')
+            thumbnail_url='https://steamcdn-a.akamaihd.net/steam/apps/570/capsule_184x69.jpg',
+            parse_only=SoupStrainer(class_='newsPostBlock steam_updates'),
+            stop_after=utils.StopAfter(class_='newsPostBlock steam_updates'))
 
 
 class OverwatchScraper(WebScraper):
@@ -88,16 +96,17 @@ class OverwatchScraper(WebScraper):
                          source_url='http://playoverwatch.com/en-us/game/patch-notes/pc/',
                          navigate_html=lambda soup: soup.find(
                              class_='column lg-3').find(class_='u-float-left').get('href'),
-                         use_browser=True,
+                         use_browser=False,
                          delay=60 * 60 * 24,
                          author=('Overwatch', 'https://playoverwatch.com/en-us/'),
                          color=0xFA9C1E,
-                         thumbnail_url='https://i.imgur.com/E1CqJXn.png')
+                         thumbnail_url='https://i.imgur.com/E1CqJXn.png',
+                         parse_only=SoupStrainer(class_='column lg-3'))
 
     async def build_embed(self, url):
         url = f'{self.source_url}{url}'
 
-        soup = await utils.fetch_soup_with_browser(self.bot, url)
+        soup = await self.fetch_soup(url)
 
         if soup is None:
             return None
@@ -135,49 +144,17 @@ class FortniteScraper(WebScraper):
     def __init__(self, bot):
         super().__init__(bot,
                          output_channel_id=OUTPUT_CHANNEL_ID[0],
-                         source_url=f'{self.BASE_URL}/fortnite/en-US/news/category/patch%20notes',
-                         navigate_html=lambda soup: soup.find(class_='top-featured-activity').find('a').get('href'),
-                         use_browser=True,
+                         source_url=f'{self.BASE_URL}/fortnite/api/blog/getPosts'
+                                    f'?category=patch%20notes&postsPerPage=1&offset=0&locale=en-US',
+                         navigate_html=None,
+                         embedded_data=utils.EmbeddedData(),
+                         navigate_data=lambda data: f'{self.BASE_URL}/fortnite/en-US/news/'
+                                                    f'{data["blogList"][0]["slug"]}',
                          delay=60 * 60 * 24,
                          author=('Fortnite', self.BASE_URL),
                          color=0x342353,
                          thumbnail_url='https://i.imgur.com/ICluMYQ.png')
 
-    async def build_embed(self, url):
-        soup = await utils.fetch_soup_with_browser(self.bot, f'{self.BASE_URL}{url}')
-
-        if soup is None:
-            return None
-
-        content = soup.find(class_='patch-notes-header section container-fluid')
-
-        if content is None:
-            return None
-
-        title = content.find('h1').get_text(strip=True)
-
-        description = soup.find('div', class_='col-xs-12 col-sm-11 col-lg-8').find('h1').get_text(strip=True)
-
-        url = f'{self.BASE_URL}{url}'
-
-        embed = discord.Embed(
-            title=title,
-            description=description,
-            url=url,
-            color=self.color)
-
-        image_url = content.find(class_='background-image').get('style')
-        image_url = image_url[image_url.find('(') + 1:image_url.find(')')]
-        embed.set_image(url=image_url)
-
-        if self.thumbnail_url:
-            embed.set_thumbnail(url=self.thumbnail_url)
-
-        if self.author:
-            embed.set_author(name=self.author[0], url=self.author[1])
-
-        return embed
-
 
 class RealmRoyaleScraper(SteamScraper):
 
@@ -194,6 +171,8 @@ class RealmRoyaleScraper(SteamScraper):
 
 class RuneScapeScraper(WebScraper):
 
+    LATEST_ARTICLE = SoupStrainer(class_='news-article ')
+
     def __init__(self, bot):
         super().__init__(
             bot,
@@ -204,11 +183,13 @@ class RuneScapeScraper(WebScraper):
             delay=60 * 60 * 24,
             author=('RuneScape', 'https://oldschool.runescape.com/'),
             color=0x162431,
-            thumbnail_url='https://i.imgur.com/6H15qI6.png'
+            thumbnail_url='https://i.imgur.com/6H15qI6.png',
+            parse_only=self.LATEST_ARTICLE,
+            stop_after=utils.StopAfter(class_='news-article ')
         )
 
     async def build_embed(self, url):
-        soup = await utils.fetch_soup(self.bot, self.source_url)
+        soup = await self.fetch_soup(self.source_url, parse_only=self.parse_only, stop_after=self.stop_after)
 
         if soup is None:
             return None
@@ -240,13 +221,16 @@ class MinecraftScraper(WebScraper):
 
     BASE_URL = 'https://minecraft.net'
 
+    ARTICLE_BODY = SoupStrainer(class_='site-body ')
+
     def __init__(self, bot):
         super().__init__(
             bot,
             output_channel_id=OUTPUT_CHANNEL_ID[0],
-            source_url=f'{self.BASE_URL}/en-us/',
-            navigate_html=lambda soup: soup.find(id='1-2').find('a').get('href'),
-            use_browser=True,
+            source_url=f'{self.BASE_URL}/content/minecraft-net/_jcr_content.articles.grid?pageSize=1',
+            navigate_html=None,
+            embedded_data=utils.EmbeddedData(),
+            navigate_data=lambda data: data['article_grid'][0]['article_url'],
             delay=60 * 60 * 24,
             author=('Minecraft', 'https://minecraft.net/en-us/'),
             color=0x9ECF66,
@@ -256,7 +240,7 @@ class MinecraftScraper(WebScraper):
     async def build_embed(self, url):
         url = f'{self.BASE_URL}{url}'
 
-        soup = await utils.fetch_soup(self.bot, url)
+        soup = await self.fetch_soup(url, parse_only=self.ARTICLE_BODY)
 
         if soup is None:
             return None
@@ -299,7 +283,7 @@ class DarkestDungeonScraper(SteamScraper):
 
 class WebScrapers:
 
-    __slots__ = ('bot',
+    __slots__ = ('bot', 'scheduler',
                  'lol_scraper', 'd2_scraper',
                  'ow_scraper',
                  'fn_scraper', 'rr_scraper',
@@ -309,6 +293,7 @@ class WebScrapers:
 
     def __init__(self, bot):
         self.bot = bot
+        self.scheduler = ScraperScheduler(self.bot)
 
         self.lol_scraper = LeagueOfLegendsScraper(self.bot)
         self.d2_scraper = DotaScraper(self.bot)
@@ -324,9 +309,10 @@ class WebScrapers:
 
     def start_scrapers(self):
         for slot in self.__slots__:
-            if slot == 'bot':
+            if slot in ('bot', 'scheduler'):
                 continue
-            self.bot.loop.create_task(getattr(self, slot).poll())
+            self.scheduler.add(slot, getattr(self, slot))
+        self.bot.loop.create_task(self.scheduler.run())
 
     @commands.group(name='toggle')
     async def toggle(self, ctx):
@@ -338,10 +324,12 @@ class WebScrapers:
                 color=zoinks.bot.color))
 
     def _toggle(self, name):
-        if name == 'bot' or name not in self.__slots__:
+        if name in ('bot', 'scheduler') or name not in self.__slots__:
             raise ValueError('Invalid web scraper name')
         scraper = getattr(self, name)
         scraper.is_running = not scraper.is_running
+        if scraper.is_running:
+            self.scheduler.resume(name)
         return scraper.is_running
 
     @staticmethod
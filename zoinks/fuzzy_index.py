@@ -0,0 +1,121 @@
+from collections import defaultdict
+import re
+
+
+# The lowest similarity, from 0 to 1, a result may have.
+MIN_SCORE = 0.3
+
+# The scores of names that start with the query or with a word equal to it, and of names containing it.
+PREFIX_SCORE = 0.9
+SUBSTRING_SCORE = 0.8
+
+# The shortest query matched as a substring, since shorter ones are contained in too many names.
+MIN_SUBSTRING_LENGTH = 3
+
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+def normalize(text: str):
+    return NON_ALPHANUMERIC.sub('', text.lower())
+
+
+def words(text: str):
+    """Returns the normalized words of the text, e.g. ['master', 'yi'] for 'Master Yi'.
+
+    :rtype: list
+    """
+    return [word for word in NON_ALPHANUMERIC.split(text.lower()) if word]
+
+
+def trigrams(text: str):
+    """Returns the trigrams of the normalized text, padded so short words and word starts still match.
+
+    :rtype: set
+    """
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Represents an in-memory fuzzy search index over names.
+
+    Every name and each of its words is split into trigrams once, and an inverted index maps each trigram to the
+    names containing it, so a search only scores the names that share a trigram with the query instead of
+    comparing every name.
+    """
+
+    def __init__(self, entries):
+        """Constructs a new index.
+
+        :param entries: The (key, name) pairs to index. A key may have several names, e.g. a display name and an
+            internal name.
+        """
+        self._keys = []
+        self._names = []
+        self._words = []
+        self._sizes = []
+        self._exact = {}
+        self._postings = defaultdict(list)
+
+        for key, name in entries:
+            if not name:
+                continue
+            normalized = normalize(name)
+            if not normalized:
+                continue
+
+            position = len(self._keys)
+            name_words = words(name)
+            grams = trigrams(normalized).union(*(trigrams(word) for word in name_words))
+            self._keys.append(key)
+            self._names.append(normalized)
+            self._words.append(name_words)
+            self._sizes.append(len(grams))
+            self._exact.setdefault(normalized, key)
+            for gram in grams:
+                self._postings[gram].append(position)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def search(self, query: str, limit: int=5):
+        """Finds the keys whose names are most similar to the query.
+
+        Names are scored by the Dice coefficient of their trigrams. Names or words starting with the query rank
+        first, followed by names containing it, so partial input like 'inf' finds 'Infinity Edge' and 'yi' finds
+        'Master Yi'.
+
+        :param query: The name to search for. Case, spaces and punctuation are ignored.
+        :param limit: The maximum results.
+        :return: The (key, score) pairs of the best matches, best first, with scores from 0 to 1.
+        :rtype: list
+        """
+        normalized = normalize(query)
+        if not normalized:
+            return []
+
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            return [(exact, 1.0)]
+
+        grams = trigrams(normalized)
+        shared = defaultdict(int)
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        best = {}
+        for position, count in shared.items():
+            score = 2 * count / (len(grams) + self._sizes[position])
+            name = self._names[position]
+            if name.startswith(normalized) or any(word.startswith(normalized) for word in self._words[position]):
+                score = max(score, PREFIX_SCORE)
+            elif len(normalized) >= MIN_SUBSTRING_LENGTH and normalized in name:
+                score = max(score, SUBSTRING_SCORE)
+            if score < MIN_SCORE:
+                continue
+            key = self._keys[position]
+            if score > best.get(key, 0):
+                best[key] = score
+
+        return sorted(best.items(), key=lambda result: -result[1])[:limit]
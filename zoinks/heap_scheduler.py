@@ -0,0 +1,99 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+
+class HeapScheduler:
+    """Runs background jobs from a single task as they come due.
+
+    Jobs are kept in a min-heap of next-due times. Rescheduling a job pushes a new entry, and entries that no longer
+    match the job's next_due are skipped once they're popped. Due jobs run as tasks under a concurrency cap, and a
+    job is never run again while it's still running.
+
+    Subclasses look jobs up by key in _job and run them in _run. A job has a key and a next_due attribute.
+    """
+
+    def __init__(self, bot, max_concurrent: int, save_interval: float=None):
+        """Constructs a new heap scheduler.
+
+        :param bot: The currently running ZOINKS Discord bot.
+        :param max_concurrent: The maximum jobs running at once.
+        :param save_interval: The seconds between saves while _dirty is set. None never saves from the loop.
+        """
+        self.bot = bot
+        self.save_interval = save_interval
+
+        self._heap = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._running = set()
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def save(self):
+        raise NotImplementedError
+
+    def _job(self, key):
+        """Returns the job with the specified key, or None if it was removed."""
+        raise NotImplementedError
+
+    def _ready(self, job):
+        """Returns whether or not the due job should run. Jobs that don't are dropped until they're rescheduled."""
+        return True
+
+    async def _run(self, job):
+        raise NotImplementedError
+
+    def is_running(self, key):
+        return key in self._running
+
+    def _schedule(self, job, due: float):
+        job.next_due = due
+        heapq.heappush(self._heap, (due, next(self._counter), job.key))
+        self._wakeup.set()
+
+    async def run(self):
+        """Runs jobs as they come due until the bot closes.
+
+        :return: None
+        """
+        await self.bot.wait_until_ready()
+        while not self.bot.is_closed():
+            if self._dirty and self.save_interval is not None and time.monotonic() - self._saved_at > self.save_interval:
+                self.save()
+
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            due, _, key = self._heap[0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, self.save_interval or delay))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            job = self._job(key)
+            if job is None or job.next_due != due:
+                continue
+
+            job.next_due = None
+            if key in self._running or not self._ready(job):
+                continue
+
+            self._running.add(key)
+            await self._semaphore.acquire()
+            self.bot.loop.create_task(self._run_job(key, job))
+
+    async def _run_job(self, key, job):
+        try:
+            await self._run(job)
+        finally:
+            self._running.discard(key)
+            self._semaphore.release()
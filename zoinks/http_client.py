@@ -0,0 +1,180 @@
+import aiohttp
+
+import asyncio
+import logging
+import random
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth another attempt, since they usually mean the host is briefly overloaded.
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# Methods safe to send again. Other requests, like webhook POSTs, are only retried if they couldn't connect,
+# since a timeout or an error status may come after the host already acted on them.
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+
+class HTTPProfile:
+    """Represents how requests of one kind are sent, e.g. how long they may take and how often they're retried."""
+
+    __slots__ = ('timeout', 'retries', 'backoff', 'headers')
+
+    def __init__(self, timeout: float=10, retries: int=2, backoff: float=0.5, headers: dict=None):
+        """Constructs a new HTTP profile.
+
+        :param timeout: The seconds a call may take in total, including its retries.
+        :param retries: The retries after a connection error, a timeout or a status in RETRY_STATUSES.
+            Requests with a method not in IDEMPOTENT_METHODS are only retried after a connection error.
+        :param backoff: The base seconds between retries, doubled after each retry and jittered.
+        :param headers: The headers sent with every request of this profile.
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = headers or {}
+
+
+PROFILES = {
+    'default': HTTPProfile(),
+    # Riot Games API requests are retried by RiotGamesAPI, so every attempt goes through its rate limiter.
+    'riot': HTTPProfile(timeout=10, retries=0),
+    'scrape': HTTPProfile(timeout=30, retries=2, backoff=2, headers={'User-Agent': 'Mozilla/5.0'}),
+    'discord-webhook': HTTPProfile(timeout=15, retries=2, headers={'Content-Type': 'application/json'}),
+}
+
+
+class HostStats:
+    """Represents the requests sent to a single host."""
+
+    __slots__ = ('requests', 'errors', 'bytes', 'latency_total', 'latency_max')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    @property
+    def latency_mean(self):
+        return self.latency_total / self.requests if self.requests else 0.0
+
+
+class _RequestContextManager:
+
+    __slots__ = ('_client', '_method', '_url', '_profile', '_timeout', '_kwargs', '_response')
+
+    def __init__(self, client, method, url, profile, timeout, kwargs):
+        self._client = client
+        self._method = method
+        self._url = url
+        self._profile = profile
+        self._timeout = timeout
+        self._kwargs = kwargs
+        self._response = None
+
+    async def __aenter__(self):
+        self._response = await self._client._send(self._method, self._url, self._profile, self._timeout,
+                                                  self._kwargs)
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._client._host_stats(self._url).bytes += self._response.content.total_bytes
+        self._response.release()
+
+
+class HTTPClient:
+    """Represents the HTTP client shared by every part of the bot.
+
+    All requests go through one connection pool with keep-alive, a DNS cache and a per-host connection limit,
+    so one slow host can't take every connection. Each call picks a named profile from PROFILES for its
+    deadline, retries and headers. Latency, bytes and errors are counted per host.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop=None,
+                 limit: int=100,
+                 limit_per_host: int=10,
+                 dns_cache_ttl: int=60 * 5,
+                 keepalive_timeout: float=30):
+        """Constructs a new HTTP client.
+
+        :param loop: The event loop of the currently running ZOINKS Discord bot.
+        :param limit: The maximum open connections.
+        :param limit_per_host: The maximum open connections to a single host.
+        :param dns_cache_ttl: The seconds a resolved host name is cached for.
+        :param keepalive_timeout: The seconds an idle connection is kept open for reuse.
+        """
+        self.loop = loop or asyncio.get_event_loop()
+        connector = aiohttp.TCPConnector(limit=limit,
+                                         limit_per_host=limit_per_host,
+                                         ttl_dns_cache=dns_cache_ttl,
+                                         keepalive_timeout=keepalive_timeout,
+                                         loop=self.loop)
+        self.session = aiohttp.ClientSession(connector=connector, loop=self.loop)
+        self.stats = defaultdict(HostStats)
+
+    def _host_stats(self, url):
+        return self.stats[urlsplit(str(url)).hostname]
+
+    def request(self, method: str, url: str, profile: str='default', timeout: float=None, **kwargs):
+        """Sends a request with the specified profile.
+
+        Use as an async context manager, like aiohttp.ClientSession.request.
+
+        :param method: The HTTP method.
+        :param url: The URL to send the request to.
+        :param profile: The name of the profile in PROFILES to send the request with.
+        :param timeout: The seconds the call may take in total, overriding the profile's timeout.
+        :param kwargs: Passed to aiohttp.ClientSession.request.
+        :raises aiohttp.ClientError: The request failed on every attempt.
+        :raises asyncio.TimeoutError: The request didn't finish before its deadline.
+        """
+        return _RequestContextManager(self, method, url, PROFILES[profile], timeout, kwargs)
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    async def _send(self, method, url, profile, timeout, kwargs):
+        stats = self._host_stats(url)
+        deadline = self.loop.time() + (timeout if timeout is not None else profile.timeout)
+        headers = dict(profile.headers, **kwargs.pop('headers', None) or {})
+
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            start = self.loop.time()
+            if start >= deadline:
+                raise asyncio.TimeoutError()
+
+            stats.requests += 1
+            try:
+                response = await self.session.request(method, url, headers=headers,
+                                                      timeout=aiohttp.ClientTimeout(total=deadline - start),
+                                                      **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                stats.errors += 1
+                if attempt >= profile.retries or not (idempotent or isinstance(e, aiohttp.ClientConnectorError)):
+                    raise
+                logger.debug(f'{method} {url} failed: {e!r}')
+            else:
+                latency = self.loop.time() - start
+                stats.latency_total += latency
+                stats.latency_max = max(stats.latency_max, latency)
+                if response.status not in RETRY_STATUSES or attempt >= profile.retries or not idempotent:
+                    return response
+                stats.errors += 1
+                response.release()
+                logger.debug(f'{method} {url} failed: {response.status}')
+
+            delay = profile.backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+            await asyncio.sleep(min(delay, max(deadline - self.loop.time(), 0)))
+            attempt += 1
+
+    async def close(self):
+        await self.session.close()
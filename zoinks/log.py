@@ -0,0 +1,11 @@
+import logging
+import sys
+
+
+def setup_logging(stream=sys.stdout):
+    logging.getLogger('discord').setLevel(logging.WARNING)
+    logging.basicConfig(
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+        datefmt="%Y-%m-%d %H:%M:%S",
+        level=logging.INFO,
+        stream=stream)
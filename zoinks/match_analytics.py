@@ -0,0 +1,57 @@
+import numpy as np
+
+
+def summarize_matches(matches: list, summoner_id: int):
+    """Summarizes the summoner's performance over the specified matches.
+
+    The per-match stats are collected into NumPy arrays once, and every aggregate is computed from them
+    without iterating over the matches again.
+
+    :param matches: The matches to summarize.
+    :type matches: list of zoinks.riot_models.Match
+    :param summoner_id: The summoner to summarize.
+    :return: The summary, or None if the summoner played in none of the matches.
+        The 'champions' entry lists (champion ID, games, win rate, KDA) tuples, most played first.
+    :rtype: dict
+    """
+    rows = []
+    for match in matches:
+        player = match.participant(summoner_id)
+        if player is None:
+            continue
+        rows.append((player.champion_id or 0, player.win, player.kills, player.deaths, player.assists, player.cs,
+                     match.game_duration))
+
+    if not rows:
+        return None
+
+    data = np.array(rows, dtype=np.int64)
+    champion_ids, wins, kills, deaths, assists, cs, durations = data.T
+
+    games = len(data)
+    total_kills, total_deaths, total_assists = kills.sum(), deaths.sum(), assists.sum()
+    minutes = durations.sum() / 60.0
+
+    champions, inverse = np.unique(champion_ids, return_inverse=True)
+    champion_games = np.bincount(inverse)
+    champion_wins = np.bincount(inverse, weights=wins)
+    champion_takedowns = np.bincount(inverse, weights=kills + assists)
+    champion_deaths = np.bincount(inverse, weights=deaths)
+    champion_kdas = champion_takedowns / np.maximum(champion_deaths, 1)
+    order = np.lexsort((-champion_wins, -champion_games))
+
+    return {
+        'games': games,
+        'wins': int(wins.sum()),
+        'win_rate': float(wins.mean()),
+        'kills': float(kills.mean()),
+        'deaths': float(deaths.mean()),
+        'assists': float(assists.mean()),
+        'kda': float((total_kills + total_assists) / max(total_deaths, 1)),
+        'cs_per_min': float(cs.sum() / minutes) if minutes else 0.0,
+        'champions': [(int(champions[i]),
+                       int(champion_games[i]),
+                       float(champion_wins[i] / champion_games[i]),
+                       float(champion_kdas[i]))
+                      for i in order]
+    }
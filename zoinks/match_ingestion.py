@@ -0,0 +1,124 @@
+import zoinks.utils as utils
+
+import asyncio
+import json
+import logging
+import os
+
+
+logger = logging.getLogger(__name__)
+
+FILE_DIR = 'zoinks/data/'
+FILE_NAME = 'match_cursors.json'
+FILE_PATH = os.path.join(FILE_DIR, FILE_NAME)
+
+# The match references read for an account that has no cursor yet, so a first sync doesn't read its whole history.
+INITIAL_BACKFILL = 20
+
+# The maximum match requests in flight for a single sync.
+MAX_CONCURRENT_FETCHES = 5
+
+
+class MatchIngester:
+    """Keeps the match store current for a set of accounts.
+
+    A cursor of the newest ingested match (game ID and timestamp) is kept per account, so each sync only asks
+    for matches newer than it and pages through them lazily. Matches reach the match store through
+    RiotGamesAPI.get_match_by_match_id.
+    """
+
+    def __init__(self, api):
+        """Constructs a new match ingester and loads the saved cursors.
+
+        :param api: The Riot Games API client to ingest matches with.
+        """
+        self.api = api
+        self.cursors = {}
+        self._syncing = {}
+
+        self.load()
+
+    def load(self):
+        if not os.path.isfile(FILE_PATH):
+            return
+
+        with open(FILE_PATH, 'r') as file:
+            self.cursors = json.load(file)
+
+    def save(self):
+        utils.save_json_atomic(FILE_PATH, self.cursors)
+
+    @staticmethod
+    def _cursor_key(region: str, account_id: int):
+        return f'{region}:{account_id}'
+
+    async def sync(self, region: str, account_id: int):
+        """Ingests the account's matches that are newer than its cursor.
+
+        Concurrent syncs of the same account share one run. The cursor only moves once every newer match was
+        listed and stored, so a sync that fails partway is repeated in full by the next one.
+
+        :param region: The region of the account.
+        :param account_id: The account ID.
+        :return: The number of matches ingested.
+        :rtype: int
+        """
+        key = self._cursor_key(region, account_id)
+        future = self._syncing.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._sync(key, region, account_id))
+            self._syncing[key] = future
+            future.add_done_callback(lambda _: self._syncing.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _sync(self, key: str, region: str, account_id: int):
+        cursor = self.cursors.get(key)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def fetch(match_id):
+            async with semaphore:
+                return await self.api.get_match_by_match_id(match_id=match_id, region=region)
+
+        if cursor is None:
+            pages = self.api.iter_match_list_by_account_id(account_id=account_id, region=region,
+                                                           page_size=INITIAL_BACKFILL)
+        else:
+            pages = self.api.iter_match_list_by_account_id(account_id=account_id, region=region,
+                                                           begin_time=cursor['timestamp'] + 1)
+
+        newest = None
+        ingested = 0
+        failed = False
+        try:
+            async for page in pages:
+                # The rest of the range couldn't be listed, so the cursor mustn't move past it.
+                if isinstance(page, int):
+                    failed = True
+                    break
+                references = [reference for reference in page
+                              if cursor is None or (reference['gameId'] != cursor['game_id'] and
+                                                    reference['timestamp'] > cursor['timestamp'])]
+                if not references:
+                    break
+                if newest is None:
+                    newest = references[0]
+
+                matches = await asyncio.gather(*[fetch(reference['gameId']) for reference in references])
+                fetched = sum(1 for match in matches if not isinstance(match, int))
+                ingested += fetched
+                # A match that's gone (404) will never be fetched, so it mustn't hold the cursor back.
+                failed |= any(isinstance(match, int) and match != 404 for match in matches)
+
+                if cursor is None or len(references) < len(page):
+                    break
+        finally:
+            await pages.aclose()
+
+        if failed:
+            logger.warning(f'Unable to ingest every match of account {account_id} ({region}), retrying next sync')
+        elif newest is not None:
+            self.cursors[key] = {'game_id': newest['gameId'], 'timestamp': newest['timestamp']}
+            self.save()
+            logger.info(f'Ingested {ingested} matches of account {account_id} ({region})')
+
+        return ingested
@@ -0,0 +1,131 @@
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+
+
+logger = logging.getLogger(__name__)
+
+FILE_DIR = 'zoinks/data/'
+FILE_NAME = 'matches.sqlite3'
+FILE_PATH = os.path.join(FILE_DIR, FILE_NAME)
+
+# The maximum bytes of compressed match payloads kept before the least recently used ones are evicted.
+MAX_SIZE = 256 * 1024 * 1024
+
+# The fraction of MAX_SIZE evicted down to, so eviction doesn't run on every insert once full.
+EVICT_TO = 0.9
+
+# The reads whose access times are held in memory before they're written, so a read doesn't commit on its own.
+TOUCH_BATCH = 100
+
+
+class MatchStore:
+    """Represents a persistent store of match payloads, compressed with zlib in SQLite
+    and keyed by (platform, match ID).
+
+    Matches never change once played, so a stored match never has to be fetched again. Access times of reads
+    are batched and written with the next put, every TOUCH_BATCH reads, or on close.
+    """
+
+    def __init__(self, path: str=FILE_PATH, max_size: int=MAX_SIZE):
+        """Opens or creates a match store.
+
+        :param path: The path of the SQLite database file.
+        :param max_size: The maximum bytes of compressed payloads to keep.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.max_size = max_size
+        self._touched = {}
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS matches ('
+            'platform TEXT NOT NULL, '
+            'match_id INTEGER NOT NULL, '
+            'payload BLOB NOT NULL, '
+            'size INTEGER NOT NULL, '
+            'accessed_at REAL NOT NULL, '
+            'PRIMARY KEY (platform, match_id))')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS matches_accessed_at ON matches (accessed_at)')
+
+        self.size = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM matches').fetchone()[0]
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM matches').fetchone()[0]
+
+    def __contains__(self, key: tuple):
+        platform, match_id = key
+        return self._connection.execute('SELECT 1 FROM matches WHERE platform = ? AND match_id = ?',
+                                        (platform, match_id)).fetchone() is not None
+
+    def get(self, platform: str, match_id: int):
+        """Returns the stored match, or None if it isn't stored.
+
+        :param platform: The platform ID the match was played on, e.g. 'NA1'.
+        :param match_id: The match ID.
+        :rtype: dict
+        """
+        row = self._connection.execute('SELECT payload FROM matches WHERE platform = ? AND match_id = ?',
+                                       (platform, match_id)).fetchone()
+        if row is None:
+            return None
+
+        self._touched[(platform, match_id)] = time.time()
+        if len(self._touched) >= TOUCH_BATCH:
+            with self._connection:
+                self._write_touched()
+        return json.loads(zlib.decompress(row[0]).decode('utf8'))
+
+    def put(self, platform: str, match_id: int, match: dict):
+        """Stores the match, evicting the least recently used matches if the store is full.
+
+        :param platform: The platform ID the match was played on, e.g. 'NA1'.
+        :param match_id: The match ID.
+        :param match: The match payload.
+        :return: None
+        """
+        payload = zlib.compress(json.dumps(match, separators=(',', ':')).encode('utf8'))
+
+        with self._connection:
+            self._write_touched()
+            row = self._connection.execute('SELECT size FROM matches WHERE platform = ? AND match_id = ?',
+                                           (platform, match_id)).fetchone()
+            self._connection.execute('INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?)',
+                                     (platform, match_id, payload, len(payload), time.time()))
+        self.size += len(payload) - (row[0] if row else 0)
+
+        if self.size > self.max_size:
+            self._evict()
+
+    def _write_touched(self):
+        """Writes the batched access times. The caller commits them."""
+        touched, self._touched = self._touched, {}
+        self._connection.executemany('UPDATE matches SET accessed_at = ? WHERE platform = ? AND match_id = ?',
+                                     [(accessed_at, platform, match_id)
+                                      for (platform, match_id), accessed_at in touched.items()])
+
+    def _evict(self):
+        target = self.max_size * EVICT_TO
+        evicted = 0
+        with self._connection:
+            rows = self._connection.execute('SELECT platform, match_id, size FROM matches ORDER BY accessed_at')
+            for platform, match_id, size in rows.fetchall():
+                if self.size <= target:
+                    break
+                self._connection.execute('DELETE FROM matches WHERE platform = ? AND match_id = ?',
+                                         (platform, match_id))
+                self.size -= size
+                evicted += 1
+        logger.info(f'Evicted {evicted} matches from the match store')
+
+    def close(self):
+        with self._connection:
+            self._write_touched()
+        self._connection.close()
@@ -0,0 +1,232 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Development key limits, used until the first response reports the real ones.
+DEFAULT_APP_RATE_LIMIT = '20:1,100:120'
+
+# Extra time waited past a window reset to absorb clock drift between us and Riot.
+WINDOW_MARGIN = 0.05
+
+
+def parse_rate_limit_header(header: str):
+    """Parses a Riot rate limit header such as '20:1,100:120' into (value, window) pairs.
+
+    :param header: The X-*-Rate-Limit or X-*-Rate-Limit-Count header value.
+    :return: A list of (value, window in seconds) tuples.
+    :rtype: list
+    """
+    pairs = []
+    if not header:
+        return pairs
+    for pair in header.split(','):
+        try:
+            value, window = pair.split(':')
+            pairs.append((int(value), int(window)))
+        except ValueError:
+            logger.warning(f'Malformed rate limit header: {header}')
+    return pairs
+
+
+class RateLimitBucket:
+    """Represents a single fixed window of a Riot rate limit, e.g. 100 requests every 120 seconds."""
+
+    __slots__ = ('limit', 'window', 'count', 'reset_at')
+
+    def __init__(self, limit: int, window: int):
+        self.limit = limit
+        self.window = window
+        self.count = 0
+        self.reset_at = None
+
+    def _roll(self, now: float):
+        if self.reset_at is not None and now >= self.reset_at:
+            self.count = 0
+            self.reset_at = None
+
+    def delay(self, now: float):
+        """Returns the number of seconds until another request fits in this window."""
+        self._roll(now)
+        if self.count < self.limit:
+            return 0
+        return self.reset_at - now + WINDOW_MARGIN
+
+    def consume(self, now: float):
+        self._roll(now)
+        if self.reset_at is None:
+            self.reset_at = now + self.window
+        self.count += 1
+
+    def sync(self, count: int, now: float):
+        """Catches the local count up with the count Riot reports for this window."""
+        self._roll(now)
+        if self.reset_at is None:
+            self.reset_at = now + self.window
+        self.count = max(self.count, count)
+
+
+class RateLimiter:
+    """Paces Riot Games API requests per platform (application limit) and per method (method limit).
+
+    Limits are learned from the X-App-Rate-Limit and X-Method-Rate-Limit headers and kept in sync with their
+    -Count counterparts. A 429 blocks the offending scope for its Retry-After. Waiting requests are released
+    in priority order, so interactive commands go ahead of background jobs, and a request for a method that's
+    blocked doesn't hold back requests for other methods.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop=None, default_app_rate_limit: str=DEFAULT_APP_RATE_LIMIT):
+        self.loop = loop or asyncio.get_event_loop()
+        self.default_app_rate_limit = default_app_rate_limit
+
+        self._buckets = {}
+        self._blocked_until = {}
+        self._lanes = {}
+        self._dispatchers = {}
+        self._wakeups = {}
+        self._counter = itertools.count()
+
+    @staticmethod
+    def _app_key(platform: str):
+        return platform, None
+
+    @staticmethod
+    def _method_key(platform: str, method: str):
+        return platform, method
+
+    def _get_buckets(self, key: tuple):
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            if key[1] is None:
+                pairs = parse_rate_limit_header(self.default_app_rate_limit)
+                buckets = [RateLimitBucket(limit, window) for limit, window in pairs]
+            else:
+                buckets = []
+            self._buckets[key] = buckets
+        return buckets
+
+    def _delay(self, key: tuple, now: float):
+        blocked = self._blocked_until.get(key, 0) - now
+        return max([blocked, 0] + [bucket.delay(now) for bucket in self._get_buckets(key)])
+
+    def _consume(self, key: tuple, now: float):
+        for bucket in self._get_buckets(key):
+            bucket.consume(now)
+
+    def sustained_rate(self, platform: str):
+        """Returns the requests per second the platform's application limit allows in the long run.
+
+        :param platform: The platform ID, e.g. 'NA1'.
+        :rtype: float
+        """
+        buckets = self._get_buckets(self._app_key(platform))
+        return min((bucket.limit / bucket.window for bucket in buckets), default=math.inf)
+
+    async def acquire(self, platform: str, method: str, priority: int=PRIORITY_INTERACTIVE):
+        """Waits until a request to the specified method can be sent without exceeding any known limit.
+
+        :param platform: The platform ID, e.g. 'NA1'.
+        :param method: The method key, e.g. 'summoner-by-name'.
+        :param priority: The lane of the request. Lower values are released first.
+        :return: None
+        """
+        waiter = self.loop.create_future()
+        heapq.heappush(self._lanes.setdefault(platform, []), (priority, next(self._counter), method, waiter))
+        self._wakeups.setdefault(platform, asyncio.Event()).set()
+
+        dispatcher = self._dispatchers.get(platform)
+        if dispatcher is None or dispatcher.done():
+            self._dispatchers[platform] = self.loop.create_task(self._dispatch(platform))
+
+        await waiter
+
+    async def _dispatch(self, platform: str):
+        lane = self._lanes[platform]
+        wakeup = self._wakeups[platform]
+        app_key = self._app_key(platform)
+
+        while lane:
+            wakeup.clear()
+            now = time.monotonic()
+
+            app_delay = self._delay(app_key, now)
+            if app_delay > 0:
+                await asyncio.sleep(app_delay)
+                continue
+
+            released = None
+            min_delay = None
+            for entry in sorted(lane):
+                _, _, method, waiter = entry
+                if waiter.done():
+                    released = entry
+                    break
+                method_delay = self._delay(self._method_key(platform, method), now)
+                if method_delay == 0:
+                    self._consume(app_key, now)
+                    self._consume(self._method_key(platform, method), now)
+                    waiter.set_result(None)
+                    released = entry
+                    break
+                if min_delay is None or method_delay < min_delay:
+                    min_delay = method_delay
+
+            if released is not None:
+                lane.remove(released)
+                heapq.heapify(lane)
+            else:
+                # Only blocked methods are waiting, so a request for another method may be released right away.
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=min_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+        del self._dispatchers[platform]
+
+    def update(self, platform: str, method: str, status: int, headers):
+        """Updates the known limits and counts from the headers of a Riot Games API response.
+
+        :param platform: The platform ID the request was sent to.
+        :param method: The method key of the request.
+        :param status: The HTTP status code of the response.
+        :param headers: The response headers.
+        :return: None
+        """
+        now = time.monotonic()
+        app_key = self._app_key(platform)
+        method_key = self._method_key(platform, method)
+
+        for key, limit_header, count_header in ((app_key, 'X-App-Rate-Limit', 'X-App-Rate-Limit-Count'),
+                                                (method_key, 'X-Method-Rate-Limit', 'X-Method-Rate-Limit-Count')):
+            limits = parse_rate_limit_header(headers.get(limit_header))
+            if limits:
+                existing = {bucket.window: bucket for bucket in self._get_buckets(key)}
+                buckets = []
+                for limit, window in limits:
+                    bucket = existing.get(window) or RateLimitBucket(limit, window)
+                    bucket.limit = limit
+                    buckets.append(bucket)
+                self._buckets[key] = buckets
+
+            counts = dict((window, count) for count, window in parse_rate_limit_header(headers.get(count_header)))
+            for bucket in self._get_buckets(key):
+                if bucket.window in counts:
+                    bucket.sync(counts[bucket.window], now)
+
+        if status == 429:
+            try:
+                retry_after = float(headers.get('Retry-After', 1))
+            except ValueError:
+                retry_after = 1
+            scope = headers.get('X-Rate-Limit-Type', 'method')
+            key = app_key if scope == 'application' else method_key
+            self._blocked_until[key] = max(self._blocked_until.get(key, 0), now + retry_after)
+            logger.warning(f'Rate limited ({scope}) on {platform} {method}, retrying after {retry_after} seconds')
@@ -1,6 +1,24 @@
 import config
+from zoinks.cache import TTLCache
+from zoinks.http_client import HTTPClient
+from zoinks.match_store import MatchStore
+from zoinks.rate_limiter import RateLimiter, PRIORITY_INTERACTIVE
+from zoinks.riot_models import ActiveGame, LeagueEntry, Match, MasteryEntry, Summoner
 
-PROFILE_ICON_URL = 'http://ddragon.leagueoflegends.com/cdn/8.14.1/img/profileicon/{icon_id}.png'
+import aiohttp
+
+import asyncio
+import copy
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ICON_URL = 'http://ddragon.leagueoflegends.com/cdn/{version}/img/profileicon/{icon_id}.png'
+CHAMPION_ICON_URL = 'http://ddragon.leagueoflegends.com/cdn/{version}/img/champion/{key}.png'
+ITEM_ICON_URL = 'http://ddragon.leagueoflegends.com/cdn/{version}/img/item/{item_id}.png'
+
+# The Data Dragon version used until static data has been loaded.
+DEFAULT_VERSION = '8.14.1'
 
 REGION = {
     'br': {
@@ -76,6 +94,42 @@ URL = {
     'summoner-by-name': 'summoner/v{version}/summoners/by-name/{name}',
 }
 
+# Seconds each response is cached for, keyed like URL. None caches it until evicted, 0 never caches it.
+TTL = {
+    'champion-mastery-by-summoner-id': 60 * 5,
+    'champions-by-champion-id': 60 * 60,
+    'champions': 60 * 60,
+    'league-by-summoner-id': 60 * 5,
+    'lol-static-data': 60 * 60 * 24,
+    'lol-status': 60,
+    'match-by-match-id': 60 * 10,
+    'match-lists-by-account-id': 60,
+    'spectator-by-summoner-id': 30,
+    'summoner-by-name': 60 * 10,
+}
+
+# Seconds a 404 is cached for, so repeated lookups of missing summoners or games cost nothing.
+NOT_FOUND_TTL = 30
+
+CACHE_SIZE = 4096
+
+# Matches are cached apart from the rest, so paging through a match history doesn't evict every other response.
+# Older ones are read back from the match store, which keeps every match on disk.
+MATCH_CACHE_SIZE = 1000
+
+# Attempts per request, so a 429 is retried once its Retry-After has passed.
+MAX_ATTEMPTS = 3
+
+# Statuses retried through the rate limiter, which waits out the Retry-After of a 429.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# The status returned when the request couldn't be sent or timed out on every attempt.
+SERVICE_UNAVAILABLE = 503
+
+# The status returned when the request isn't back by the deadline of the client view that sent it.
+# The request itself keeps running, so a later call for the same data is served from it or from the cache.
+REQUEST_TIMEOUT = 408
+
 
 def queue_name_from_id(id_: int):
     if id_ == 400 or id_ == 430:
@@ -102,12 +156,94 @@ def queue_name_from_id(id_: int):
 
 class RiotGamesAPI:
 
-    def __init__(self, bot):
+    def __init__(self, bot=None, priority: int=PRIORITY_INTERACTIVE, base_url: str=None,
+                 loop: asyncio.AbstractEventLoop=None, http_client: HTTPClient=None):
+        """Constructs a new Riot Games API client.
+
+        Without a bot, the client runs standalone (e.g. in offline jobs) and owns an HTTP client of its own,
+        which close() closes.
+
+        :param bot: The currently running ZOINKS Discord bot, whose loop and http_client are used.
+        :param priority: The rate limiter lane requests are sent in.
+        :param base_url: The Riot Games API base URL, e.g. of a stand-in server.
+        :param loop: The event loop to use without a bot.
+        :param http_client: The HTTP client to use without a bot.
+        """
         self._api_key = config.RIOT_GAMES_API_KEY
         self._default_region = 'na'
+        self.base_url = base_url or config.RIOT_GAMES_API_BASE_URL or URL['base']
         self.bot = bot
+        self.loop = bot.loop if bot is not None else loop or asyncio.get_event_loop()
+        self._owns_http_client = bot is None and http_client is None
+        if bot is not None:
+            self.http_client = bot.http_client
+        else:
+            self.http_client = http_client or HTTPClient(loop=self.loop)
+        self.priority = priority
+        self.deadline = None
+        self.use_cache = True
+        self.rate_limiter = RateLimiter(loop=self.loop)
+        self.cache = TTLCache(max_size=CACHE_SIZE)
+        self.match_cache = TTLCache(max_size=MATCH_CACHE_SIZE)
+        self._in_flight = {}
+        self.match_store = MatchStore()
+
+    def with_priority(self, priority: int):
+        """Returns a view of this client that sends its requests in the specified rate limiter lane.
+
+        The view shares the rate limiter, the response cache, the match store and in-flight requests with this client.
+        """
+        api = copy.copy(self)
+        api.priority = priority
+        return api
+
+    def with_deadline(self, seconds: float):
+        """Returns a view of this client whose requests give up after the specified seconds from now.
+
+        A request that isn't back in time returns REQUEST_TIMEOUT instead of waiting for its response.
+        The view shares the rate limiter, the response cache, the match store and in-flight requests with this client.
+        """
+        api = copy.copy(self)
+        api.deadline = self.loop.time() + seconds
+        return api
+
+    def without_cache(self):
+        """Returns a view of this client whose requests are never served from the response cache, e.g. for polls
+        that have to see changes as soon as they happen.
+
+        Its responses still update the cache, and identical requests in flight are still shared.
+        The view shares the rate limiter, the response cache, the match store and in-flight requests with this client.
+        """
+        api = copy.copy(self)
+        api.use_cache = False
+        return api
+
+    async def close(self):
+        """Closes the HTTP client if this client owns it, and the match store.
+
+        :return: None
+        """
+        if self._owns_http_client:
+            await self.http_client.close()
+        self.match_store.close()
+
+    def _platform(self, region):
+        if region is None:
+            region = self._default_region
+        else:
+            region = region.lower()
+            if region not in REGION:
+                raise ValueError(f'Invalid region: {region}')
+        return REGION[region]['platform']
+
+    async def _request(self, method, url, region, match_id: int=None, model=None, **kwargs):
+        """Sends a request, or serves it from the cache, the match store or an identical request in flight.
 
-    async def _request(self, url, region, **kwargs):
+        :param match_id: The match ID of a match request, whose payload is kept in the match store.
+        :param model: Parses a successful response into the compact record returned and cached in its place,
+            e.g. Summoner or LeagueEntry.from_list. Without it, the response is returned as is.
+        :return: The response, or its status code if it wasn't successful.
+        """
         params = {'api_key': self._api_key}
         for key, value in kwargs.items():
             if key not in params and value is not None:
@@ -115,27 +251,87 @@ class RiotGamesAPI:
                     value = str(value).lower()
                 params[key] = value
 
-        if region is None:
-            region = self._default_region
+        platform = self._platform(region)
+        url = self.base_url.format(platform=platform, url=url)
+
+        key = self._cache_key(platform, url, params)
+        if self.use_cache:
+            cached = self._cache_for(match_id).get(key)
+            if cached is not None:
+                return cached
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load(key, method, platform, url, params, match_id, model),
+                                           loop=self.loop)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        if self.deadline is None:
+            return await asyncio.shield(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future),
+                                          timeout=max(self.deadline - self.loop.time(), 0))
+        except asyncio.TimeoutError:
+            return REQUEST_TIMEOUT
+
+    async def _load(self, key, method, platform, url, params, match_id, model):
+        if match_id is not None:
+            match = self.match_store.get(platform, match_id)
+            if match is not None:
+                match = model(match) if model is not None else match
+                self.match_cache.set(key, match, ttl=TTL.get(method, 0))
+                return match
+
+        result = await self._fetch(method, platform, url, params)
+        if match_id is not None and isinstance(result, dict):
+            self.match_store.put(platform, match_id, result)
+        if model is not None and not isinstance(result, int):
+            result = model(result)
+        if isinstance(result, int):
+            if result == 404:
+                self._cache_for(match_id).set(key, result, ttl=NOT_FOUND_TTL)
         else:
-            region = region.lower()
-            if region not in REGION:
-                raise ValueError(f'Invalid region: {region}')
-
-        url = URL['base'].format(platform=REGION[region]['platform'], url=url)
-
-        async with self.bot.session.get(url=url, params=params) as response:
-            return await response.json() if response.status == 200 else response.status
+            ttl = TTL.get(method, 0)
+            if ttl != 0:
+                self._cache_for(match_id).set(key, result, ttl=ttl)
+        return result
+
+    def _cache_for(self, match_id: int=None):
+        return self.match_cache if match_id is not None else self.cache
+
+    @staticmethod
+    def _cache_key(platform, url, params):
+        return platform, url, tuple(sorted(
+            (key, tuple(sorted(value)) if isinstance(value, (set, list, tuple)) else value)
+            for key, value in params.items() if key != 'api_key'))
+
+    async def _fetch(self, method, platform, url, params):
+        for attempt in range(MAX_ATTEMPTS):
+            await self.rate_limiter.acquire(platform, method, self.priority)
+            try:
+                async with self.http_client.get(url, profile='riot', params=params) as response:
+                    self.rate_limiter.update(platform, method, response.status, response.headers)
+                    if response.status in RETRY_STATUSES and attempt + 1 < MAX_ATTEMPTS:
+                        continue
+                    return await response.json() if response.status == 200 else response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f'Request to {url} failed: {e!r}')
+                if attempt + 1 >= MAX_ATTEMPTS:
+                    return SERVICE_UNAVAILABLE
 
     async def get_champion_mastery_by_summoner_id(self, summoner_id: int, region: str=None):
         return await self._request(
+            method='champion-mastery-by-summoner-id',
             url=URL['champion-mastery-by-summoner-id'].format(
                 version=VERSION['champion-mastery'],
                 summoner_id=summoner_id),
-            region=region)
+            region=region,
+            model=MasteryEntry.from_list)
 
     async def get_champion_list(self, free_to_play: bool=False):
         return await self._request(
+            method='champions',
             url=URL['champions'].format(
                 version=VERSION['champion']
             ),
@@ -144,6 +340,7 @@ class RiotGamesAPI:
 
     async def get_champion_by_champion_id(self, champion_id: int):
         return await self._request(
+            method='champions-by-champion-id',
             url=URL['champions-by-champion-id'].format(
                 version=VERSION['champion'],
                 champion_id=champion_id),
@@ -151,23 +348,28 @@ class RiotGamesAPI:
 
     async def get_league_by_summoner_id(self, summoner_id: int, region: str=None):
         return await self._request(
+            method='league-by-summoner-id',
             url=URL['league-by-summoner-id'].format(
                 version=VERSION['league'],
                 summoner_id=summoner_id),
-            region=region)
+            region=region,
+            model=LeagueEntry.from_list)
 
-    async def get_static_champion_data(self, tags: str='all', data_by_id: bool=False):
+    async def get_static_champion_data(self, tags: str='all', data_by_id: bool=False, version: str=None):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category='champions'),
             region=None,
             locale='en_US',
             tags=tags,
-            dataById=data_by_id)
+            dataById=data_by_id,
+            version=version)
 
     async def get_static_champion_data_by_id(self, id_: int, tags: str='all'):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category=f'champions/{id_}'),
@@ -175,17 +377,20 @@ class RiotGamesAPI:
             locale='en_US',
             tags=tags)
 
-    async def get_static_item_data(self, tags: str='all'):
+    async def get_static_item_data(self, tags: str='all', version: str=None):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category='items'),
             region=None,
             locale='en_US',
-            tags=tags)
+            tags=tags,
+            version=version)
 
     async def get_static_item_data_by_id(self, id_: int, tags: str='all'):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category=f'items/{id_}'),
@@ -193,66 +398,78 @@ class RiotGamesAPI:
             locale='en_US',
             tags=tags)
 
-    async def get_static_map_data(self):
+    async def get_static_map_data(self, version: str=None):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category='maps'),
             region=None,
-            locale='en_US')
+            locale='en_US',
+            version=version)
 
     async def get_static_profile_icon_data(self):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category='profile-icons'),
             region=None,
             locale='en_US')
 
-    async def get_static_reforged_rune_path_data(self):
+    async def get_static_reforged_rune_path_data(self, version: str=None):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category='reforged-rune-paths'),
             region=None,
-            locale='en_US')
+            locale='en_US',
+            version=version)
 
     async def get_static_reforged_rune_path_data_by_id(self, id_: int):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category=f'reforged-rune-paths/{id_}'),
             region=None,
             locale='en_US')
 
-    async def get_static_reforged_rune_data(self):
+    async def get_static_reforged_rune_data(self, version: str=None):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category='reforged-runes'),
             region=None,
-            locale='en_US')
+            locale='en_US',
+            version=version)
 
     async def get_static_reforged_rune_data_by_id(self, id_: int):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category=f'reforged-runes/{id_}'),
             region=None,
             locale='en_US')
 
-    async def get_static_summoner_spell_data(self, tags: str='all', data_by_id: bool=False):
+    async def get_static_summoner_spell_data(self, tags: str='all', data_by_id: bool=False, version: str=None):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category='summoner-spells'),
             region=None,
             locale='en_US',
             tags=tags,
-            dataById=data_by_id)
+            dataById=data_by_id,
+            version=version)
 
     async def get_static_summoner_spell_data_by_id(self, id_: int, tags: str='all'):
         return await self._request(
+            method='lol-static-data',
             url=URL['lol-static-data'].format(
                 version=VERSION['lol-static-data'],
                 category=f'summoner-spells/{id_}'),
@@ -262,21 +479,27 @@ class RiotGamesAPI:
 
     async def get_server_status(self, region: str=None):
         return await self._request(
+            method='lol-status',
             url=URL['lol-status'].format(
                 version=VERSION['lol-status']),
             region=region)
 
     async def get_match_by_match_id(self, match_id: int, region: str=None):
         return await self._request(
+            method='match-by-match-id',
             url=URL['match-by-match-id'].format(
                 version=VERSION['match'],
                 match_id=match_id),
-            region=region)
+            region=region,
+            match_id=match_id,
+            model=Match)
 
     async def get_match_list_by_account_id(self, account_id: int, region: str=None,
                                            champion: set=None, queue: set=None, season: set=None,
-                                           begin_index: int=0, end_index: int=100):
+                                           begin_index: int=0, end_index: int=100,
+                                           begin_time: int=None, end_time: int=None):
         return await self._request(
+            method='match-lists-by-account-id',
             url=URL['match-lists-by-account-id'].format(
                 version=VERSION['match'],
                 account_id=account_id),
@@ -285,18 +508,51 @@ class RiotGamesAPI:
             queue=queue,
             season=season,
             beginIndex=begin_index,
-            endIndex=end_index)
+            endIndex=end_index,
+            beginTime=begin_time,
+            endTime=end_time)
+
+    async def iter_match_list_by_account_id(self, account_id: int, region: str=None, page_size: int=100, **kwargs):
+        """Pages through the account's match list, newest first, fetching each page only when it's reached.
+
+        :param page_size: The match references per page, at most 100.
+        :param kwargs: Passed to get_match_list_by_account_id, e.g. begin_time.
+        :return: An async generator of lists of match references. It stops at the first empty or partial page,
+            or after yielding the status code of the first error, so callers can tell an error from the end of
+            the list. A 404 means there are no more matches and ends the list.
+        """
+        begin_index = 0
+        while True:
+            match_list = await self.get_match_list_by_account_id(account_id=account_id, region=region,
+                                                                 begin_index=begin_index,
+                                                                 end_index=begin_index + page_size,
+                                                                 **kwargs)
+            if isinstance(match_list, int) and match_list != 404:
+                yield match_list
+                return
+            if not isinstance(match_list, dict) or not match_list.get('matches'):
+                return
+
+            yield match_list['matches']
+
+            if len(match_list['matches']) < page_size:
+                return
+            begin_index += page_size
 
     async def get_active_game_by_summoner_id(self, summoner_id: int, region: str=None):
         return await self._request(
+            method='spectator-by-summoner-id',
             url=URL['spectator-by-summoner-id'].format(
                 version=VERSION['spectator'],
                 summoner_id=summoner_id),
-            region=region)
+            region=region,
+            model=ActiveGame)
 
     async def get_summoner_by_name(self, name: str, region: str=None):
         return await self._request(
+            method='summoner-by-name',
             url=URL['summoner-by-name'].format(
                 version=VERSION['summoner'],
                 name=name),
-            region=region)
+            region=region,
+            model=Summoner)
@@ -0,0 +1,134 @@
+class Model:
+    """Represents a compact, read-only record parsed from a Riot Games API response.
+
+    Only the fields ZOINKS reads are copied out of the response, into __slots__, so the response itself can be
+    dropped as soon as it's parsed. Records are what the API client caches.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'<{self.__class__.__name__} {fields:.80}>'
+
+    @classmethod
+    def from_list(cls, data: list):
+        return [cls(entry) for entry in data]
+
+    def to_dict(self):
+        """Returns the record's fields, e.g. to write them out as JSON.
+
+        :rtype: dict
+        """
+        return {name: _to_dict(getattr(self, name)) for name in self.__slots__}
+
+
+def _to_dict(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_to_dict(entry) for entry in value]
+    return value
+
+
+class Summoner(Model):
+
+    __slots__ = ('id', 'account_id', 'name', 'level', 'profile_icon_id')
+
+    def __init__(self, data: dict):
+        self.id = data.get('id')
+        self.account_id = data.get('accountId')
+        self.name = data.get('name')
+        self.level = data.get('summonerLevel')
+        self.profile_icon_id = data.get('profileIconId')
+
+
+class LeagueEntry(Model):
+
+    __slots__ = ('queue_type', 'tier', 'rank', 'league_points', 'wins', 'losses')
+
+    def __init__(self, data: dict):
+        self.queue_type = data.get('queueType')
+        self.tier = data.get('tier')
+        self.rank = data.get('rank')
+        self.league_points = data.get('leaguePoints')
+        self.wins = data.get('wins', 0)
+        self.losses = data.get('losses', 0)
+
+    @property
+    def win_rate(self):
+        games = self.wins + self.losses
+        return self.wins / games if games else 0.0
+
+
+class MasteryEntry(Model):
+
+    __slots__ = ('champion_id', 'champion_level', 'champion_points')
+
+    def __init__(self, data: dict):
+        self.champion_id = data.get('championId')
+        self.champion_level = data.get('championLevel')
+        self.champion_points = data.get('championPoints')
+
+
+class Participant(Model):
+
+    __slots__ = ('summoner_id', 'summoner_name', 'champion_id', 'team_id', 'win', 'kills', 'deaths', 'assists',
+                 'cs')
+
+    def __init__(self, data: dict, player: dict=None):
+        """Parses a participant of an active game, or of a match together with its player identity.
+
+        :param data: The participant.
+        :param player: The player of the participant's identity in a match. Active game participants carry their
+            player fields themselves.
+        """
+        player = data if player is None else player
+        stats = data.get('stats', {})
+
+        self.summoner_id = player.get('summonerId')
+        self.summoner_name = player.get('summonerName')
+        self.champion_id = data.get('championId')
+        self.team_id = data.get('teamId')
+        self.win = stats.get('win', False)
+        self.kills = stats.get('kills', 0)
+        self.deaths = stats.get('deaths', 0)
+        self.assists = stats.get('assists', 0)
+        self.cs = stats.get('totalMinionsKilled', 0)
+
+
+class ActiveGame(Model):
+
+    __slots__ = ('game_id', 'queue_id', 'participants')
+
+    def __init__(self, data: dict):
+        self.game_id = data.get('gameId')
+        self.queue_id = data.get('gameQueueConfigId')
+        self.participants = tuple(Participant(participant) for participant in data.get('participants', ()))
+
+    def participant(self, summoner_id: int):
+        """Returns the participant with the specified summoner ID, or None if they aren't in this game."""
+        return next((participant for participant in self.participants
+                     if participant.summoner_id == summoner_id), None)
+
+
+class Match(Model):
+
+    __slots__ = ('game_id', 'queue_id', 'game_creation', 'game_duration', 'participants')
+
+    def __init__(self, data: dict):
+        self.game_id = data.get('gameId')
+        self.queue_id = data.get('queueId')
+        self.game_creation = data.get('gameCreation')
+        self.game_duration = data.get('gameDuration', 0)
+
+        participants = {participant.get('participantId'): participant
+                        for participant in data.get('participants', ())}
+        self.participants = tuple(Participant(participants[identity['participantId']], identity.get('player', {}))
+                                  for identity in data.get('participantIdentities', ())
+                                  if identity.get('participantId') in participants)
+
+    def participant(self, summoner_id: int):
+        """Returns the participant with the specified summoner ID, or None if they aren't in this match."""
+        return next((participant for participant in self.participants
+                     if participant.summoner_id == summoner_id), None)
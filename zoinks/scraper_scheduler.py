@@ -0,0 +1,148 @@
+import zoinks.utils as utils
+from zoinks.heap_scheduler import HeapScheduler
+from zoinks.seen_store import SeenStore
+
+import json
+import logging
+import os
+import random
+import time
+from datetime import datetime
+
+
+logger = logging.getLogger(__name__)
+
+FILE_DIR = 'zoinks/data/'
+FILE_NAME = 'scraper_schedule.json'
+FILE_PATH = os.path.join(FILE_DIR, FILE_NAME)
+
+# The seconds over which the first checks after startup are spread.
+STARTUP_SPREAD = 60 * 5
+
+# The fraction of an interval added or removed at random, so checks of sources with the same delay drift apart.
+JITTER = 0.1
+
+# The maximum checks running at once.
+MAX_CONCURRENT_CHECKS = 2
+
+# The most a source's delay is stretched by after checks that find nothing new.
+MAX_BACKOFF = 3
+BACKOFF_FACTOR = 1.5
+
+# On the weekdays a source usually posts on, it's checked this many times as often as its delay.
+PATCH_DAY_SPEEDUP = 6
+
+# The posts per source whose weekdays are remembered, and how many of them a weekday needs to be a patch day.
+POST_HISTORY = 8
+PATCH_DAY_MIN_POSTS = 2
+
+
+class ScheduledScraper:
+    """Represents the schedule of a single web scraper."""
+
+    __slots__ = ('name', 'scraper', 'backoff', 'post_weekdays', 'next_due')
+
+    def __init__(self, name: str, scraper, backoff: float=1, post_weekdays: list=()):
+        self.name = name
+        self.scraper = scraper
+        self.backoff = backoff
+        self.post_weekdays = list(post_weekdays)
+        self.next_due = None
+
+    @property
+    def key(self):
+        return self.name
+
+    def is_patch_day(self, weekday: int):
+        return self.post_weekdays.count(weekday) >= PATCH_DAY_MIN_POSTS
+
+    def to_dict(self):
+        return {'backoff': self.backoff,
+                'post_weekdays': self.post_weekdays}
+
+
+class ScraperScheduler(HeapScheduler):
+    """Checks every web scraper from a single task as they come due.
+
+    Checks are run by a HeapScheduler under a global concurrency cap. The first checks are spread over a few
+    minutes after startup. A source that keeps having nothing new is checked less and less often, up to
+    MAX_BACKOFF times its delay, while on the weekdays it usually posts on it's checked PATCH_DAY_SPEEDUP times
+    as often. Turned off scrapers are dropped from the heap until they're turned back on.
+    Posted items are recorded in a SeenStore, so a restart doesn't post them again.
+    """
+
+    def __init__(self, bot):
+        """Constructs a new scraper scheduler and loads the saved schedules.
+
+        :param bot: The currently running ZOINKS Discord bot.
+        """
+        super().__init__(bot, max_concurrent=MAX_CONCURRENT_CHECKS)
+        self.seen = SeenStore()
+
+        self.scheduled = {}
+        self._saved = {}
+
+        self.load()
+
+    def load(self):
+        if not os.path.isfile(FILE_PATH):
+            return
+
+        with open(FILE_PATH, 'r') as file:
+            self._saved = json.load(file)
+
+    def save(self):
+        self._saved.update({name: scheduled.to_dict() for name, scheduled in self.scheduled.items()})
+        utils.save_json_atomic(FILE_PATH, self._saved, indent=4)
+
+    def add(self, name: str, scraper):
+        """Schedules the scraper's first check at a random point shortly after startup.
+
+        :param name: The unique name the scraper's schedule is saved under.
+        :param scraper: The web scraper to check.
+        :type scraper: zoinks.web_scraper.WebScraper
+        """
+        scheduled = ScheduledScraper(name, scraper, **self._saved.get(name, {}))
+        self.scheduled[name] = scheduled
+        self._schedule(scheduled, time.monotonic() + random.uniform(0, STARTUP_SPREAD))
+
+    def resume(self, name: str):
+        """Checks the scraper right away, e.g. after it was turned back on. A scraper that's being checked is
+        rescheduled once its check finishes instead.
+
+        :return: None
+        """
+        scheduled = self.scheduled[name]
+        if scheduled.next_due is None and not self.is_running(name):
+            self._schedule(scheduled, time.monotonic())
+
+    def _interval(self, scheduled: ScheduledScraper):
+        """Returns the seconds until the scraper should be checked again."""
+        delay = scheduled.scraper.delay
+        interval = delay * scheduled.backoff
+        if scheduled.is_patch_day(datetime.now().weekday()):
+            interval = min(interval, delay / PATCH_DAY_SPEEDUP)
+        return interval * random.uniform(1 - JITTER, 1 + JITTER)
+
+    def _job(self, key: str):
+        return self.scheduled.get(key)
+
+    def _ready(self, scheduled: ScheduledScraper):
+        return scheduled.scraper.is_running
+
+    async def _run(self, scheduled: ScheduledScraper):
+        try:
+            found = await scheduled.scraper.check(self.seen)
+        except Exception as e:
+            logger.warning(f'Unable to check {scheduled.name}: {e!r}')
+            found = False
+
+        if found:
+            scheduled.backoff = 1
+            scheduled.post_weekdays = (scheduled.post_weekdays + [datetime.now().weekday()])[-POST_HISTORY:]
+        else:
+            scheduled.backoff = min(scheduled.backoff * BACKOFF_FACTOR, MAX_BACKOFF)
+        self.save()
+
+        if scheduled.scraper.is_running and scheduled.next_due is None:
+            self._schedule(scheduled, time.monotonic() + self._interval(scheduled))
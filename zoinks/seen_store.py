@@ -0,0 +1,68 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+
+
+logger = logging.getLogger(__name__)
+
+FILE_DIR = 'zoinks/data/'
+FILE_NAME = 'seen_items.sqlite3'
+FILE_PATH = os.path.join(FILE_DIR, FILE_NAME)
+
+# The items remembered per source. Older ones are forgotten, since sources only ever show their latest items.
+MAX_ITEMS_PER_SOURCE = 100
+
+
+def digest(item: str):
+    return hashlib.sha1(item.encode('utf8')).hexdigest()
+
+
+class SeenStore:
+    """Represents a persistent record of the items web scrapers have already posted, in SQLite
+    and keyed by (source, SHA-1 of the item).
+
+    It survives restarts, so a scraper doesn't post its source's latest item again every time the bot starts.
+    """
+
+    def __init__(self, path: str=FILE_PATH):
+        """Opens or creates a seen item store.
+
+        :param path: The path of the SQLite database file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS seen ('
+            'source TEXT NOT NULL, '
+            'digest TEXT NOT NULL, '
+            'seen_at REAL NOT NULL, '
+            'PRIMARY KEY (source, digest))')
+
+    def __contains__(self, key: tuple):
+        source, item = key
+        return self._connection.execute('SELECT 1 FROM seen WHERE source = ? AND digest = ?',
+                                        (source, digest(item))).fetchone() is not None
+
+    def add(self, source: str, item: str):
+        """Records the item as posted from the source, forgetting the source's oldest items past
+        MAX_ITEMS_PER_SOURCE.
+
+        :param source: The source URL the item was found at.
+        :param item: The item's identity, e.g. its URL.
+        """
+        with self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO seen (source, digest, seen_at) VALUES (?, ?, ?)',
+                                     (source, digest(item), time.time()))
+            self._connection.execute(
+                'DELETE FROM seen WHERE source = ? AND digest NOT IN ('
+                'SELECT digest FROM seen WHERE source = ? ORDER BY seen_at DESC LIMIT ?)',
+                (source, source, MAX_ITEMS_PER_SOURCE))
+
+    def close(self):
+        self._connection.close()
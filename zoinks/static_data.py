@@ -0,0 +1,217 @@
+import zoinks.utils as utils
+from zoinks.fuzzy_index import TrigramIndex
+
+import aiohttp
+
+import asyncio
+import json
+import logging
+import os
+import time
+
+
+logger = logging.getLogger(__name__)
+
+FILE_DIR = 'zoinks/data/'
+FILE_NAME = 'static_data.json'
+FILE_PATH = os.path.join(FILE_DIR, FILE_NAME)
+
+VERSIONS_URL = 'https://ddragon.leagueoflegends.com/api/versions.json'
+
+# The seconds between checks for a new game version, so reconnects don't check every time.
+VERSION_CHECK_INTERVAL = 60 * 60
+
+
+def _names_by_id(entries):
+    """Indexes static data entries by their ID.
+
+    :param entries: The 'data' dict or list of a static data response.
+    :return: A dict of str(ID) to name.
+    :rtype: dict
+    """
+    if isinstance(entries, dict):
+        entries = entries.values()
+    return {str(entry.get('id', entry.get('mapId'))): entry.get('name', entry.get('mapName')) for entry in entries}
+
+
+class StaticDataStore:
+    """Represents the League of Legends static data for the current game version.
+
+    The data is kept on disk in a compact form (champion names in an array indexed by champion ID, everything
+    else as ID to name dicts) and loaded without any network requests. It is only fetched again when
+    Data Dragon reports a new game version.
+    """
+
+    def __init__(self, bot, api):
+        """Constructs a new static data store and loads the last saved snapshot.
+
+        :param bot: The currently running ZOINKS Discord bot.
+            Used for its http_client and loop attributes.
+        :param api: The Riot Games API client to fetch static data with.
+        """
+        self.bot = bot
+        self.api = api
+
+        self.version = None
+        self.champion_names = []
+        self.champion_keys = []
+        self.items = {}
+        self.maps = {}
+        self.reforged_rune_paths = {}
+        self.reforged_runes = {}
+        self.summoner_spells = {}
+
+        self.champion_index = TrigramIndex(())
+        self.item_index = TrigramIndex(())
+        self.summoner_spell_index = TrigramIndex(())
+        self._indexed_version = None
+
+        self._checked_at = None
+        self._refresh_task = None
+
+        self.load()
+
+    @property
+    def loaded(self):
+        return self.version is not None
+
+    def champion_name(self, champion_id: int):
+        if 0 <= champion_id < len(self.champion_names) and self.champion_names[champion_id] is not None:
+            return self.champion_names[champion_id]
+        return f'Champion {champion_id}'
+
+    def champion_key(self, champion_id: int):
+        if 0 <= champion_id < len(self.champion_keys):
+            return self.champion_keys[champion_id]
+        return None
+
+    def load(self):
+        if not os.path.isfile(FILE_PATH):
+            return
+
+        try:
+            with open(FILE_PATH, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f'Unable to load static data: {e}')
+            return
+
+        self.version = data.get('version')
+        self.champion_names = data.get('champion_names', [])
+        self.champion_keys = data.get('champion_keys', [])
+        self.items = data.get('items', {})
+        self.maps = data.get('maps', {})
+        self.reforged_rune_paths = data.get('reforged_rune_paths', {})
+        self.reforged_runes = data.get('reforged_runes', {})
+        self.summoner_spells = data.get('summoner_spells', {})
+        self._build_indexes()
+        logger.info(f'Loaded static data for version {self.version}')
+
+    def _build_indexes(self):
+        """Rebuilds the fuzzy search indexes if the version changed since they were last built."""
+        if self._indexed_version == self.version:
+            return
+
+        champions = [(champion_id, name) for champion_id, name in enumerate(self.champion_names)]
+        champions += [(champion_id, key) for champion_id, key in enumerate(self.champion_keys)]
+        self.champion_index = TrigramIndex(champions)
+        self.item_index = TrigramIndex((int(item_id), name) for item_id, name in self.items.items())
+        self.summoner_spell_index = TrigramIndex((int(spell_id), name)
+                                                 for spell_id, name in self.summoner_spells.items())
+        self._indexed_version = self.version
+
+    def save(self):
+        data = {'version': self.version,
+                'champion_names': self.champion_names,
+                'champion_keys': self.champion_keys,
+                'items': self.items,
+                'maps': self.maps,
+                'reforged_rune_paths': self.reforged_rune_paths,
+                'reforged_runes': self.reforged_runes,
+                'summoner_spells': self.summoner_spells}
+
+        utils.save_json_atomic(FILE_PATH, data, separators=(',', ':'))
+
+    async def fetch_version(self):
+        """Fetches the current game version from Data Dragon.
+
+        :return: The current game version, or None if it couldn't be fetched.
+        :rtype: str
+        """
+        try:
+            async with self.bot.http_client.get(VERSIONS_URL) as response:
+                if response.status >= 400:
+                    return None
+                versions = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f'Unable to fetch the game version: {e!r}')
+            return None
+        return versions[0] if versions else None
+
+    async def refresh(self):
+        """Fetches every static dataset concurrently if the game version changed since the last snapshot.
+
+        :return: Whether or not the static data was updated.
+        :rtype: bool
+        """
+        self._checked_at = time.monotonic()
+
+        version = await self.fetch_version()
+        if version is None or version == self.version:
+            return False
+
+        champions, items, maps, reforged_rune_paths, reforged_runes, summoner_spells = await asyncio.gather(
+            self.api.get_static_champion_data(tags='all', data_by_id=True, version=version),
+            self.api.get_static_item_data(tags='all', version=version),
+            self.api.get_static_map_data(version=version),
+            self.api.get_static_reforged_rune_path_data(version=version),
+            self.api.get_static_reforged_rune_data(version=version),
+            self.api.get_static_summoner_spell_data(tags='all', data_by_id=True, version=version))
+
+        datasets = (champions, items, maps, reforged_rune_paths, reforged_runes, summoner_spells)
+        failed = [dataset for dataset in datasets if isinstance(dataset, int)]
+        if failed:
+            logger.warning(f'Unable to fetch static data for version {version}: {failed}')
+            return False
+
+        champion_ids = [int(champion_id) for champion_id in champions['data']]
+        self.champion_names = [None] * (max(champion_ids, default=-1) + 1)
+        self.champion_keys = [None] * len(self.champion_names)
+        for champion_id, champion in zip(champion_ids, champions['data'].values()):
+            self.champion_names[champion_id] = champion.get('name')
+            self.champion_keys[champion_id] = champion.get('key')
+
+        self.items = _names_by_id(items['data'])
+        self.maps = _names_by_id(maps['data'])
+        self.reforged_rune_paths = _names_by_id(reforged_rune_paths)
+        self.reforged_runes = _names_by_id(reforged_runes)
+        self.summoner_spells = _names_by_id(summoner_spells['data'])
+        self.version = version
+        self._build_indexes()
+
+        self.save()
+        logger.info(f'Updated static data to version {version}')
+        return True
+
+    def refresh_in_background(self):
+        """Schedules a refresh unless one is running or the version was checked recently.
+
+        :return: None
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        if (self.loaded and self._checked_at is not None and
+                time.monotonic() - self._checked_at < VERSION_CHECK_INTERVAL):
+            return
+        self._refresh_task = self.bot.loop.create_task(self.refresh())
+
+    async def wait_until_loaded(self):
+        """Waits for the first refresh if no snapshot was saved yet.
+
+        :return: Whether or not static data is available.
+        :rtype: bool
+        """
+        if not self.loaded:
+            self.refresh_in_background()
+            await asyncio.shield(self._refresh_task)
+        return self.loaded
@@ -0,0 +1,298 @@
+import zoinks.riot_games_api as riot_games_api
+import zoinks.utils as utils
+from zoinks.heap_scheduler import HeapScheduler
+from zoinks.rate_limiter import PRIORITY_BACKGROUND
+from zoinks.riot_games_api import REGION
+from zoinks.riot_models import ActiveGame
+
+import discord
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+
+
+logger = logging.getLogger(__name__)
+
+FILE_DIR = 'zoinks/data/'
+FILE_NAME = 'tracked_summoners.json'
+FILE_PATH = os.path.join(FILE_DIR, FILE_NAME)
+
+color = 0x96692A
+
+# The Riot Games API requests sent per poll (league and spectator).
+REQUESTS_PER_POLL = 2
+
+# The fraction of each platform's sustained rate limit the watcher may use, leaving the rest for commands.
+BUDGET_SHARE = 0.5
+
+# The bounds of the seconds between polls of an active summoner.
+MIN_INTERVAL = 60
+MAX_BACKOFF = 16
+
+# The seconds without a rank change or a game before a summoner is only polled every DORMANT_INTERVAL seconds.
+DORMANT_AFTER = 60 * 60 * 24 * 7
+DORMANT_INTERVAL = 60 * 60 * 24
+
+# The maximum polls in flight at once.
+MAX_CONCURRENT_POLLS = 10
+
+# The seconds between saves of tracked summoner state.
+SAVE_INTERVAL = 60 * 5
+
+
+class TrackedSummoner:
+    """Represents a summoner tracked by one or more Discord text channels."""
+
+    __slots__ = ('region', 'summoner_id', 'account_id', 'name', 'channel_ids',
+                 'tier', 'rank', 'league_points', 'game_id', 'last_active', 'backoff', 'weight', 'next_due')
+
+    def __init__(self, region: str, summoner_id: int, account_id: int, name: str, channel_ids: list=(),
+                 tier: str=None, rank: str=None, league_points: int=None, game_id: int=None,
+                 last_active: float=None):
+        self.region = region
+        self.summoner_id = summoner_id
+        self.account_id = account_id
+        self.name = name
+        self.channel_ids = set(channel_ids)
+        self.tier = tier
+        self.rank = rank
+        self.league_points = league_points
+        self.game_id = game_id
+        self.last_active = last_active or time.time()
+        self.backoff = 1
+        self.weight = 0
+        self.next_due = None
+
+    @property
+    def key(self):
+        return self.region, self.summoner_id
+
+    @property
+    def dormant(self):
+        return time.time() - self.last_active > DORMANT_AFTER
+
+    def to_dict(self):
+        return {'region': self.region,
+                'summoner_id': self.summoner_id,
+                'account_id': self.account_id,
+                'name': self.name,
+                'channel_ids': sorted(self.channel_ids),
+                'tier': self.tier,
+                'rank': self.rank,
+                'league_points': self.league_points,
+                'game_id': self.game_id,
+                'last_active': self.last_active}
+
+
+class SummonerWatcher(HeapScheduler):
+    """Polls tracked summoners for rank changes and new games, and posts them to the channels tracking them.
+
+    Polls are run by a HeapScheduler. Each platform's polls are spread evenly over the share of
+    its rate limit left to background jobs, summoners that show no activity are polled less and less often,
+    and summoners inactive for a week are only polled once a day.
+    """
+
+    def __init__(self, bot, api, static_data, ingester=None):
+        """Constructs a new summoner watcher and loads the tracked summoners.
+
+        :param bot: The currently running ZOINKS Discord bot.
+        :param api: The Riot Games API client. Polls are sent in its background lane and skip its response cache,
+            since every poll is counted against the budget and has to see changes right away.
+        :param static_data: The static data store used for champion names.
+        :param ingester: The match ingester to sync a summoner's matches with after each of their games ends.
+        :type ingester: zoinks.match_ingestion.MatchIngester
+        """
+        super().__init__(bot, max_concurrent=MAX_CONCURRENT_POLLS, save_interval=SAVE_INTERVAL)
+        self.api = api.with_priority(PRIORITY_BACKGROUND).without_cache()
+        self.static_data = static_data
+        self.ingester = ingester
+
+        self.tracked = {}
+        self._load = {}
+
+        self.load()
+
+    def load(self):
+        if not os.path.isfile(FILE_PATH):
+            return
+
+        with open(FILE_PATH, 'r') as file:
+            data = json.load(file)
+
+        for entry in data:
+            tracked = TrackedSummoner(**entry)
+            self.tracked[tracked.key] = tracked
+
+        now = time.monotonic()
+        for tracked in self.tracked.values():
+            self._update_load(tracked)
+        for tracked in self.tracked.values():
+            self._schedule(tracked, now + random.uniform(0, self._interval(tracked)))
+
+    def save(self):
+        utils.save_json_atomic(FILE_PATH, [tracked.to_dict() for tracked in self.tracked.values()], indent=4)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def track(self, region: str, summoner, channel_id: int):
+        """Starts posting updates about the summoner in the specified channel.
+
+        :param region: The region of the summoner.
+        :param summoner: The summoner to track.
+        :type summoner: zoinks.riot_models.Summoner
+        :param channel_id: The Discord text channel to post updates in.
+        :return: Whether or not the channel wasn't tracking the summoner already.
+        :rtype: bool
+        """
+        tracked = self.tracked.get((region, summoner.id))
+        if tracked is None:
+            tracked = TrackedSummoner(region=region, summoner_id=summoner.id, account_id=summoner.account_id,
+                                      name=summoner.name)
+            self.tracked[tracked.key] = tracked
+            self._update_load(tracked)
+            self._schedule(tracked, time.monotonic())
+        elif channel_id in tracked.channel_ids:
+            return False
+        elif tracked.dormant:
+            tracked.last_active = time.time()
+            tracked.backoff = 1
+            self._update_load(tracked)
+            self._schedule(tracked, time.monotonic())
+
+        tracked.channel_ids.add(channel_id)
+        self.save()
+        return True
+
+    def untrack(self, region: str, summoner_id: int, channel_id: int):
+        """Stops posting updates about the summoner in the specified channel.
+
+        :return: Whether or not the channel was tracking the summoner.
+        :rtype: bool
+        """
+        tracked = self.tracked.get((region, summoner_id))
+        if tracked is None or channel_id not in tracked.channel_ids:
+            return False
+
+        tracked.channel_ids.discard(channel_id)
+        if not tracked.channel_ids:
+            self._update_load(tracked, removed=True)
+            del self.tracked[tracked.key]
+        self.save()
+        return True
+
+    def _platform(self, tracked: TrackedSummoner):
+        return REGION[tracked.region]['platform']
+
+    def _update_load(self, tracked: TrackedSummoner, removed: bool=False):
+        """Keeps the platform's load, the polls per base interval of all its summoners, in sync with the summoner."""
+        weight = 0 if removed or tracked.dormant else 1 / tracked.backoff
+        platform = self._platform(tracked)
+        self._load[platform] = self._load.get(platform, 0) + weight - tracked.weight
+        tracked.weight = weight
+
+    def _interval(self, tracked: TrackedSummoner):
+        """Returns the seconds until the summoner should be polled again.
+
+        Every active summoner on a platform is polled once per base interval, scaled by its backoff, where the
+        base interval is as short as the platform's budget for background polls allows.
+        """
+        if tracked.dormant:
+            return DORMANT_INTERVAL
+
+        platform = self._platform(tracked)
+        budget = self.api.rate_limiter.sustained_rate(platform) * BUDGET_SHARE
+        base_interval = max(MIN_INTERVAL, self._load.get(platform, 0) * REQUESTS_PER_POLL / budget)
+        return base_interval * tracked.backoff
+
+    def _job(self, key: tuple):
+        return self.tracked.get(key)
+
+    async def _run(self, tracked: TrackedSummoner):
+        try:
+            league, spectator = await asyncio.gather(
+                self.api.get_league_by_summoner_id(summoner_id=tracked.summoner_id, region=tracked.region),
+                self.api.get_active_game_by_summoner_id(summoner_id=tracked.summoner_id, region=tracked.region))
+            active = False
+            if isinstance(league, list):
+                active |= await self._check_league(tracked, league)
+            if not isinstance(spectator, int) or spectator == 404:
+                active |= await self._check_game(tracked, spectator if not isinstance(spectator, int) else None)
+        except Exception as e:
+            logger.warning(f'Unable to poll {tracked.name}: {e!r}')
+            active = False
+
+        if tracked.key not in self.tracked:
+            return
+
+        if active:
+            tracked.last_active = time.time()
+            tracked.backoff = 1
+            self._dirty = True
+        else:
+            tracked.backoff = min(tracked.backoff * 2, MAX_BACKOFF)
+        self._update_load(tracked)
+        self._schedule(tracked, time.monotonic() + self._interval(tracked))
+
+    async def _ingest(self, tracked: TrackedSummoner):
+        try:
+            await self.ingester.sync(tracked.region, tracked.account_id)
+        except Exception as e:
+            logger.warning(f'Unable to ingest the matches of {tracked.name}: {e!r}')
+
+    async def _check_league(self, tracked: TrackedSummoner, league: list):
+        entry = next((entry for entry in league if entry.queue_type == 'RANKED_SOLO_5x5'), None)
+        if entry is None:
+            return False
+
+        previous = (tracked.tier, tracked.rank, tracked.league_points)
+        current = (entry.tier, entry.rank, entry.league_points)
+        if previous == current:
+            return False
+
+        tracked.tier, tracked.rank, tracked.league_points = current
+        if previous == (None, None, None):
+            return True
+
+        if previous[:2] != current[:2]:
+            description = (f'{tracked.name} moved from **{previous[0].title()} {previous[1]}** '
+                           f'to **{entry.tier.title()} {entry.rank}** ({entry.league_points} LP).')
+        else:
+            difference = entry.league_points - previous[2]
+            description = (f'{tracked.name} {"gained" if difference > 0 else "lost"} {abs(difference)} LP '
+                           f'and is now **{entry.tier.title()} {entry.rank}** ({entry.league_points} LP).')
+
+        await self._post(tracked, discord.Embed(title='📈 Rank Update', description=description, color=color))
+        return True
+
+    async def _check_game(self, tracked: TrackedSummoner, game: ActiveGame):
+        if game is None:
+            if tracked.game_id is None:
+                return False
+            tracked.game_id = None
+            if self.ingester is not None:
+                self.bot.loop.create_task(self._ingest(tracked))
+            return True
+
+        if game.game_id == tracked.game_id:
+            return True
+
+        tracked.game_id = game.game_id
+        participant = game.participant(tracked.summoner_id)
+        champion_name = self.static_data.champion_name(participant.champion_id) if participant else 'a champion'
+        queue_name = riot_games_api.queue_name_from_id(id_=game.queue_id)
+
+        await self._post(tracked, discord.Embed(
+            title='🎮 Now In Game',
+            description=f'{tracked.name} is now playing a {queue_name} as {champion_name}.',
+            color=color))
+        return True
+
+    async def _post(self, tracked: TrackedSummoner, embed: discord.Embed):
+        for channel_id in tracked.channel_ids:
+            channel = self.bot.get_channel(id=channel_id)
+            if channel is not None:
+                await channel.send(embed=embed)
@@ -1,51 +1,276 @@
 from zoinks.bot import ZOINKS
 
+import aiohttp
+
 import asyncio
 import json
 import logging
 import os
-from bs4 import BeautifulSoup
+import re
+from bs4 import BeautifulSoup, SoupStrainer
 from collections import defaultdict
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
-SESSION_GET_HEADERS = {'User-Agent': 'Mozilla/5.0'}
-SESSION_POST_HEADERS = {'Content-Type': 'application/json'}
+FILE_DIR = 'zoinks/data/'
+FILE_NAME = 'http_validators.json'
+FILE_PATH = os.path.join(FILE_DIR, FILE_NAME)
 
+# Returned by fetch_soup when a conditional request found the page unchanged.
+NOT_MODIFIED = object()
 
-async def fetch_soup(bot: ZOINKS, url: str):
-    async with bot.session.get(url=url, headers=SESSION_GET_HEADERS) as response:
-        logger.debug(f'CODE {response.status}: {url}')
-        if response.status >= 400:
-            return None
+# The BeautifulSoup parser pages are parsed with unless a scraper picks another one.
+# lxml builds trees several times faster than the pure Python 'html.parser'.
+DEFAULT_PARSER = 'lxml'
+
+# The bytes read from a response at a time.
+CHUNK_SIZE = 16 * 1024
+
+# The largest response body fetch_soup reads. Larger pages are dropped instead of parsed.
+MAX_BODY_SIZE = 8 * 1024 * 1024
+
+
+class StopAfter:
+    """Represents the element a streamed fetch stops reading after.
+
+    It is matched on its tag name and the raw values of its attributes, like class_='news-article ',
+    as they appear in the page before any parsing.
+    """
+
+    __slots__ = ('name', 'attrs')
+
+    def __init__(self, name: str=None, **attrs):
+        self.name = name
+        self.attrs = {key.rstrip('_'): value for key, value in attrs.items()}
+
+    def matches(self, element):
+        if self.name is not None and element.tag != self.name:
+            return False
+        return all(element.get(key) == value for key, value in self.attrs.items())
+
+
+class ValidatorStore:
+    """Represents the ETag and Last-Modified validators of fetched pages, persisted across restarts.
+
+    Each entry also keeps the result its caller derived from the page, so a 304 Not Modified can reuse it
+    without the page being downloaded or parsed again. Validators are only sent for entries that have a result.
+    """
+
+    def __init__(self, path: str=FILE_PATH):
+        self.path = path
+        self._entries = None
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = {}
+            if os.path.isfile(self.path):
+                try:
+                    with open(self.path, 'r') as file:
+                        self._entries = json.load(file)
+                except (OSError, ValueError) as e:
+                    logger.warning(f'Unable to load HTTP validators: {e}')
+        return self._entries
+
+    def save(self):
+        save_json_atomic(self.path, self.entries, indent=4)
+
+    def headers(self, url: str):
+        """Returns the conditional request headers for the URL, which are empty if it has no result to reuse.
+
+        :rtype: dict
+        """
+        entry = self.entries.get(url)
+        if entry is None or entry.get('result') is None:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def update(self, url: str, headers):
+        """Records the validators of a full response, which invalidates the URL's result until it's set again."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            self.entries.pop(url, None)
         else:
-            content = await response.text()
-            return BeautifulSoup(content, 'html.parser')
+            self.entries[url] = {'etag': etag, 'last_modified': last_modified, 'result': None}
+
+    def result(self, url: str):
+        entry = self.entries.get(url)
+        return entry.get('result') if entry is not None else None
 
+    def set_result(self, url: str, result):
+        """Saves the result derived from the URL's last full response. It must be JSON serializable."""
+        entry = self.entries.get(url)
+        if entry is not None and entry.get('result') != result:
+            entry['result'] = result
+            self.save()
 
-@asyncio.coroutine
-def fetch_soup_with_browser(bot: ZOINKS, url: str):
-    options = Options()
-    options.headless = True
 
-    browser = webdriver.Firefox(
-            executable_path='D:\\Utilities\\geckodriver\\geckodriver.exe',
-            firefox_options=options,
-            log_path='D:\\Utilities\\geckodriver\\geckodriver.log')
-    browser.implicitly_wait(10)
+validators = ValidatorStore()
 
+
+async def fetch_soup(bot: ZOINKS, url: str, conditional: bool=False, parser: str=DEFAULT_PARSER,
+                     parse_only: SoupStrainer=None, stop_after: StopAfter=None):
+    """Fetches and parses the page at the specified URL.
+
+    :param bot: The currently running ZOINKS Discord bot.
+    :param url: The URL of the page.
+    :param conditional: Whether or not to revalidate the page with the validators in the validators store.
+        The caller should save what it derives from the page with validators.set_result.
+    :param parser: The BeautifulSoup parser to parse the page with, e.g. 'lxml', 'xml' or 'html.parser'.
+    :param parse_only: The part of the page to build a tree of. Everything outside of it is skipped.
+    :param stop_after: The element after which the rest of the page is neither downloaded nor parsed.
+    :type stop_after: StopAfter
+    :return: The parsed page, None if it couldn't be fetched or is larger than MAX_BODY_SIZE,
+        or NOT_MODIFIED if the request was conditional and the page hasn't changed.
+    :rtype: bs4.BeautifulSoup
+    """
+    headers = validators.headers(url) if conditional else {}
     try:
-        future = bot.loop.run_in_executor(None, browser.get, url)
-        yield from future
-        content = browser.page_source
-        browser.quit()
-    except Exception as e:
-        logger.warning(e)
+        async with bot.http_client.get(url, profile='scrape', headers=headers) as response:
+            logger.debug(f'CODE {response.status}: {url}')
+            if response.status == 304 and headers:
+                return NOT_MODIFIED
+            elif response.status >= 400:
+                return None
+            else:
+                content = await _read_body(response, parser, stop_after)
+                if content is None:
+                    logger.warning(f'Unable to fetch {url}: larger than {MAX_BODY_SIZE} bytes')
+                    return None
+                if conditional:
+                    validators.update(url, response.headers)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning(f'Unable to fetch {url}: {e!r}')
         return None
     else:
-        return BeautifulSoup(content, 'html.parser')
+        return BeautifulSoup(content, parser, parse_only=parse_only, from_encoding=response.charset)
+
+
+class EmbeddedData:
+    """Represents where a page embeds the data its JavaScript renders.
+
+    Either a <script> with the specified ID holds the data as JSON (e.g. '__NEXT_DATA__'), or a script assigns it
+    to the specified JavaScript variable (e.g. 'window.__INITIAL_STATE__'). With neither, the whole response is
+    JSON, as with the endpoints such pages load their data from.
+    """
+
+    __slots__ = ('script_id', 'variable')
+
+    def __init__(self, script_id: str=None, variable: str=None):
+        self.script_id = script_id
+        self.variable = variable
+
+    def decode(self, soup: BeautifulSoup):
+        """Finds and decodes the embedded data in the parsed page.
+
+        :return: The decoded data, or None if it isn't in the page.
+        """
+        if self.script_id is not None:
+            script = soup.find('script', id=self.script_id)
+            return json.loads(script.string) if script is not None and script.string else None
+
+        pattern = re.compile(rf'{re.escape(self.variable)}\s*=\s*')
+        for script in soup.find_all('script'):
+            match = pattern.search(script.string or '')
+            if match is not None:
+                return json.JSONDecoder().raw_decode(script.string, match.end())[0]
+        return None
+
+
+async def fetch_embedded_data(bot: ZOINKS, url: str, embedded: EmbeddedData, conditional: bool=False):
+    """Fetches the data a JavaScript-rendered page embeds, without running its JavaScript.
+
+    :param bot: The currently running ZOINKS Discord bot.
+    :param url: The URL of the page, or of the JSON endpoint if embedded has neither a script ID nor a variable.
+    :param embedded: Where the page embeds its data.
+    :param conditional: Whether or not to revalidate the page with the validators in the validators store.
+    :return: The decoded data, None if it couldn't be fetched or found,
+        or NOT_MODIFIED if the request was conditional and the page hasn't changed.
+    """
+    if embedded.script_id is not None or embedded.variable is not None:
+        soup = await fetch_soup(bot, url, conditional=conditional, parse_only=SoupStrainer('script'))
+        if soup is None or soup is NOT_MODIFIED:
+            return soup
+        try:
+            return embedded.decode(soup)
+        except ValueError as e:
+            logger.warning(f'Unable to decode the data embedded in {url}: {e}')
+            return None
+
+    headers = validators.headers(url) if conditional else {}
+    try:
+        async with bot.http_client.get(url, profile='scrape', headers=headers) as response:
+            logger.debug(f'CODE {response.status}: {url}')
+            if response.status == 304 and headers:
+                return NOT_MODIFIED
+            elif response.status >= 400:
+                return None
+            content = await _read_body(response, 'json')
+            if content is None:
+                logger.warning(f'Unable to fetch {url}: larger than {MAX_BODY_SIZE} bytes')
+                return None
+            if conditional:
+                validators.update(url, response.headers)
+            return json.loads(content.decode(response.charset or 'utf-8'))
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logger.warning(f'Unable to fetch {url}: {e!r}')
+        return None
+
+
+async def _read_body(response, parser: str, stop_after: StopAfter=None):
+    """Reads the response body in chunks, up to MAX_BODY_SIZE bytes.
+
+    With stop_after, every chunk is also fed to an incremental lxml parser, and the connection is closed as soon
+    as the element has ended, so only the start of the page is downloaded.
+
+    :return: The body read, or None if it's larger than MAX_BODY_SIZE.
+    :rtype: bytes
+    """
+    pull_parser = None
+    if stop_after is not None:
+        pull_parser = (etree.XMLPullParser(events=('end',), recover=True) if parser == 'xml' else
+                       etree.HTMLPullParser(events=('end',)))
+
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > MAX_BODY_SIZE:
+            response.close()
+            return None
+
+        if pull_parser is None:
+            continue
+        pull_parser.feed(chunk)
+        for _, element in pull_parser.read_events():
+            if stop_after.matches(element):
+                response.close()
+                return b''.join(chunks)
+            element.clear()
+
+    return b''.join(chunks)
+
+
+async def fetch_soup_with_browser(bot: ZOINKS, url: str, parser: str=DEFAULT_PARSER,
+                                  parse_only: SoupStrainer=None):
+    """Fetches and parses the page at the specified URL after its JavaScript ran, using the bot's browser pool.
+
+    :return: The parsed page, or None if it couldn't be fetched.
+    :rtype: bs4.BeautifulSoup
+    """
+    content = await bot.browser_pool.fetch(url)
+    if content is None:
+        return None
+    return BeautifulSoup(content, parser, parse_only=parse_only)
 
 
 def merge_nested_dicts(dict1: dict, dict2: dict):
@@ -66,6 +291,24 @@ def merge_nested_dicts(dict1: dict, dict2: dict):
     return merged_dict
 
 
+def save_json_atomic(path: str, data, **kwargs):
+    """Writes the data to the JSON file through a temporary file, so a crash mid-write never leaves it corrupt.
+
+    :param path: The path of the JSON file. Its directory is created if it doesn't exist.
+    :param data: The data to write.
+    :param kwargs: Passed to json.dump, e.g. indent.
+    :return: None
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(data, file, **kwargs)
+    os.replace(temp_path, path)
+
+
 def new_json_file(file_dir: str, file_name: str, init_dict: dict):
     if not os.path.exists(file_dir):
         os.mkdir(file_dir)
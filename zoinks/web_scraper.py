@@ -1,16 +1,25 @@
 import zoinks.bot
 import zoinks.utils as utils
 from zoinks.bot import ZOINKS
+from zoinks.cache import TTLCache
+from zoinks.seen_store import SeenStore
 
 import discord
+from bs4 import BeautifulSoup, SoupStrainer
 
-import asyncio
 import logging
 import re
 
 
 logger = logging.getLogger(__name__)
 
+# The part of an article the default build_embed reads its meta properties from.
+META_STRAINER = SoupStrainer('meta')
+
+# The parsed pages kept per scraper during a poll, and the seconds each is kept for at most.
+DOCUMENT_CACHE_SIZE = 8
+DOCUMENT_TTL = 60 * 5
+
 
 class WebScraper:
     """Represents a basic web scraper that builds from the specified URL and displays the built
@@ -24,11 +33,16 @@ class WebScraper:
                  delay: int=60 * 60 * 24,
                  author: tuple=(None, None),
                  color: int=zoinks.bot.color,
-                 thumbnail_url: str=''):
+                 thumbnail_url: str='',
+                 parser: str=utils.DEFAULT_PARSER,
+                 parse_only: SoupStrainer=None,
+                 stop_after: utils.StopAfter=None,
+                 embedded_data: utils.EmbeddedData=None,
+                 navigate_data=None):
         """Constructs a new web scraper.
 
         :param bot: The currently running ZOINKS Discord bot.
-            Used for its session attribute.
+            Used for its http_client attribute.
         :param output_channel_id: The Discord text channel to display the messages in.
         :param source_url: The homepage URL of the content to post.
         :param navigate_html: The BeautifulSoup function chain to find
@@ -39,6 +53,14 @@ class WebScraper:
             Typically matched with the homepage color scheme.
         :param thumbnail_url: The thumbnail URL of the discord.Embed to post.
             Typically used for logos.
+        :param parser: The BeautifulSoup parser to parse pages with.
+        :param parse_only: The part of the source page navigate_html reads.
+            Only that part is built into a tree, which keeps parsing large source pages fast.
+        :param stop_after: The element of the source page after which navigate_html needs nothing more.
+            The source page is only downloaded up to it.
+        :param embedded_data: Where the source page embeds the data its JavaScript renders.
+            If set, the data is decoded without a browser and navigate_data is used instead of navigate_html.
+        :param navigate_data: The function to find the URL of the latest content from the decoded data.
         """
         self.bot = bot
         self.output_channel_id = output_channel_id
@@ -55,8 +77,37 @@ class WebScraper:
         self.color = color
         self.thumbnail_url = thumbnail_url
 
+        self.parser = parser
+        self.parse_only = parse_only
+        self.stop_after = stop_after
+        self.embedded_data = embedded_data
+        self.navigate_data = navigate_data
+
         self.is_running = True
         self.last_embed = None
+        self.prev_url = ''
+
+        self.documents = TTLCache(max_size=DOCUMENT_CACHE_SIZE)
+
+    async def fetch_soup(self, url: str, conditional: bool=False, parse_only: SoupStrainer=None,
+                         stop_after: utils.StopAfter=None):
+        """Fetches and parses the page at the specified URL with this scraper's parser.
+
+        A page is downloaded and parsed at most once per poll: find_url_from_source and build_embed share the
+        parsed pages through a short-lived cache, which poll empties after every check.
+
+        :return: The parsed page, None if it couldn't be fetched,
+            or NOT_MODIFIED if the request was conditional and the page hasn't changed.
+        :rtype: bs4.BeautifulSoup
+        """
+        key = (url, self.parser, parse_only, stop_after)
+        soup = self.documents.get(key)
+        if soup is None:
+            soup = await utils.fetch_soup(self.bot, url, conditional=conditional, parser=self.parser,
+                                          parse_only=parse_only, stop_after=stop_after)
+            if isinstance(soup, BeautifulSoup):
+                self.documents.set(key, soup, ttl=DOCUMENT_TTL)
+        return soup
 
     async def find_url_from_source(self):
         """Finds the specified target URL from the source_url by using the navigate_html BS4 function chain.
@@ -65,16 +116,40 @@ class WebScraper:
             Typically used to grab the latest URL to a new news article.
         :rtype: str
         """
+        if self.embedded_data is not None:
+            return await self._find_url_from_embedded_data()
+
         if self.use_browser:
-            soup = await utils.fetch_soup_with_browser(self.bot, self.source_url)
+            soup = await utils.fetch_soup_with_browser(self.bot, self.source_url,
+                                                       parser=self.parser, parse_only=self.parse_only)
         else:
-            soup = await utils.fetch_soup(self.bot, self.source_url)
+            soup = await self.fetch_soup(self.source_url, conditional=True,
+                                         parse_only=self.parse_only, stop_after=self.stop_after)
+            if soup is utils.NOT_MODIFIED:
+                return utils.validators.result(self.source_url)
         try:
             url = self.navigate_html(soup)
         except AttributeError as e:
             logger.warning(e)
             return None
         else:
+            if not self.use_browser:
+                utils.validators.set_result(self.source_url, url)
+            return url
+
+    async def _find_url_from_embedded_data(self):
+        data = await utils.fetch_embedded_data(self.bot, self.source_url, self.embedded_data, conditional=True)
+        if data is utils.NOT_MODIFIED:
+            return utils.validators.result(self.source_url)
+        if data is None:
+            return None
+        try:
+            url = self.navigate_data(data)
+        except (KeyError, IndexError, TypeError) as e:
+            logger.warning(f'Unable to navigate the data embedded in {self.source_url}: {e!r}')
+            return None
+        else:
+            utils.validators.set_result(self.source_url, url)
             return url
 
     async def build_embed(self, url):
@@ -87,9 +162,9 @@ class WebScraper:
         :rtype discord.Embed
         """
         if self.use_browser:
-            soup = await utils.fetch_soup_with_browser(self.bot, url)
+            soup = await utils.fetch_soup_with_browser(self.bot, url, parser=self.parser, parse_only=META_STRAINER)
         else:
-            soup = await utils.fetch_soup(self.bot, url)
+            soup = await self.fetch_soup(url, parse_only=META_STRAINER)
 
         if soup is None:
             return None
@@ -120,28 +195,48 @@ class WebScraper:
 
         return embed
 
-    async def poll(self):
-        """Checks for a new URL to post content from every (delay) seconds.
+    def item_key(self, url):
+        """Returns what identifies the content found by find_url_from_source in the seen item store.
+
+        :rtype: str
+        """
+        return str(url)
+
+    async def check(self, seen: SeenStore=None):
+        """Checks the source once and posts its latest content unless it was posted before.
+
+        Scheduled by zoinks.scraper_scheduler.ScraperScheduler every (delay) seconds or so.
 
-        :return: None
+        :param seen: The store of content already posted, which outlives restarts.
+            Content in it is skipped before its embed is built.
+        :return: Whether or not new content was found.
+        :rtype: bool
         """
-        await self.bot.wait_until_ready()
         channel = self.bot.get_channel(id=self.output_channel_id)
         if channel is None:
             raise ValueError('Invalid output channel')
-        prev_url = ''
-        while self.is_running:
+
+        try:
             url = await self.find_url_from_source()
 
-            if url and url != prev_url:
-                embed = await self.build_embed(url)
-                if embed is not None:
-                    await channel.send(embed=embed)
-                    logger.info(f'Posted article "{embed.title.strip()}"')
-                    self.last_embed = embed
-                prev_url = url
+            if not url or url == self.prev_url:
+                return False
+            self.prev_url = url
+
+            key = self.item_key(url)
+            if seen is not None and (self.source_url, key) in seen:
+                return False
 
-            await asyncio.sleep(self.delay)
+            embed = await self.build_embed(url)
+            if embed is not None:
+                await channel.send(embed=embed)
+                logger.info(f'Posted article "{embed.title.strip()}"')
+                self.last_embed = embed
+                if seen is not None:
+                    seen.add(self.source_url, key)
+            return True
+        finally:
+            self.documents.clear()
 
 
 class SteamScraper(WebScraper):
@@ -156,19 +251,36 @@ class SteamScraper(WebScraper):
                          delay=delay,
                          author=author,
                          color=color,
-                         thumbnail_url=thumbnail_url)
+                         thumbnail_url=thumbnail_url,
+                         parser='xml',
+                         parse_only=SoupStrainer('item'),
+                         stop_after=utils.StopAfter('item'))
 
     async def find_url_from_source(self):
-        """Selects the first item from the Steam RSS XML instead of navigating through html."""
-        soup = await utils.fetch_soup(self.bot, self.source_url)
+        """Selects the first item from the Steam RSS XML instead of navigating through html.
+
+        The item's markup is kept as the validators store result, so an unchanged feed is only parsed up to it.
+        """
+        soup = await self.fetch_soup(self.source_url, conditional=True,
+                                     parse_only=self.parse_only, stop_after=self.stop_after)
+        if soup is utils.NOT_MODIFIED:
+            markup = utils.validators.result(self.source_url)
+            return BeautifulSoup(markup, self.parser).find('item')
         try:
-            item = soup.select_one('item')
+            item = soup.find('item')
         except AttributeError as e:
             logger.warning(e)
             return None
         else:
+            if item is not None:
+                utils.validators.set_result(self.source_url, str(item))
             return item
 
+    def item_key(self, item):
+        """Identifies an RSS item by its GUID, so edits to its description don't make it new."""
+        guid = item.find('guid')
+        return guid.get_text(strip=True) if guid is not None else str(item)
+
     async def build_embed(self, item):
         """Uses the first XML item to build an embed."""
         title = item.find('title').get_text(strip=True)
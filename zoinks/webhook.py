@@ -1,8 +1,9 @@
-import zoinks.utils as utils
 from zoinks.bot import ZOINKS
 
+import aiohttp
 import discord
 
+import asyncio
 import json
 import logging
 
@@ -25,7 +26,7 @@ class Webhook:
         """Initializes a webhook for Discord.
 
         :param bot: The currently running ZOINKS Discord bot.
-            Used for its session attribute.
+            Used for its http_client attribute.
         :param endpoint_url: The Discord webhook endpoint URL.
             Pass either the entire URL or all content after '/webhooks/'.
         :param username: The Discord webhook username.
@@ -68,12 +69,16 @@ class Webhook:
         if self.avatar_url:
             payload['avatar_url'] = self.avatar_url
 
-        async with self.bot.session.post(url=self.endpoint_url,
-                                         data=json.dumps(payload, indent=4),
-                                         headers=utils.SESSION_POST_HEADERS) as response:
-            if response.status >= 400:
-                logger.info('POST Failed')
-                return False
-            else:
-                logger.info('POST Succeeded')
-                return True
+        try:
+            async with self.bot.http_client.post(self.endpoint_url,
+                                                 profile='discord-webhook',
+                                                 data=json.dumps(payload, indent=4)) as response:
+                if response.status >= 400:
+                    logger.info('POST Failed')
+                    return False
+                else:
+                    logger.info('POST Succeeded')
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.info(f'POST Failed: {e!r}')
+            return False